@@ -2,15 +2,178 @@
 from __future__ import annotations
 
 import json
+import math
+import queue
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Iterator, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from .project import Project
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
 _DEFAULT_DB_NAME = "projects.db"
+_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -20000",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA wal_autocheckpoint = 1000",
+    "PRAGMA foreign_keys = ON",
+)
+_READ_POOL_SIZE = 4
+_STATEMENT_CACHE_SIZE = 256
+_SELECT_PAGE_SQL = "SELECT key, updated_at, data FROM projects ORDER BY name ASC, key ASC LIMIT ? OFFSET ?"
+_COUNT_SQL = "SELECT COUNT(*) FROM projects"
+_SELECT_CREATED_AT_SQL = "SELECT key, created_at FROM projects WHERE key IN (SELECT value FROM json_each(?))"
+_SELECT_ONE_SQL = "SELECT updated_at, data FROM projects WHERE key = ?"
+_DELETE_SQL = "DELETE FROM projects WHERE key = ?"
+_UPSERT_SQL = """
+    INSERT INTO projects (
+        key, name, icon, default_profile, last_profile, summary, tags,
+        status, favorite, active, usage_hours, data, created_at, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(key) DO UPDATE SET
+        name=excluded.name,
+        icon=excluded.icon,
+        default_profile=excluded.default_profile,
+        last_profile=excluded.last_profile,
+        summary=excluded.summary,
+        tags=excluded.tags,
+        status=excluded.status,
+        favorite=excluded.favorite,
+        active=excluded.active,
+        usage_hours=excluded.usage_hours,
+        data=json_set(excluded.data, '$.createdAt', projects.created_at),
+        updated_at=excluded.updated_at
+"""
+_SET_FAVORITE_SQL = """
+    UPDATE projects
+    SET favorite = ?,
+        data = json_set(data, '$.favorite', json(?), '$.updatedAt', ?),
+        updated_at = ?
+    WHERE key = ?
+    RETURNING data
+"""
+_UPDATE_LAST_PROFILE_SQL = """
+    UPDATE projects
+    SET last_profile = ?,
+        data = json_set(data, '$.lastProfile', ?, '$.updatedAt', ?),
+        updated_at = ?
+    WHERE key = ?
+    RETURNING data
+"""
+_RECORD_HISTORY_SQL = """
+    UPDATE projects
+    SET data = json_set(
+            json_insert(data, '$.history[#]', json_object('time', ?, 'description', ?)),
+            '$.updatedAt', ?
+        ),
+        updated_at = ?
+    WHERE key = ?
+    RETURNING data
+"""
+_MEMORY_PATH = ":memory:"
+
+
+def _dump_payload(payload: Any) -> str:
+    """Serialise *payload* for the ``data`` column, preferring orjson."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode()
+    return json.dumps(payload, ensure_ascii=False, sort_keys=True)
+
+
+def _load_payload(data: str | bytes) -> Any:
+    """Decode a ``data`` column value, preferring orjson."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class ConnectionPool:
+    """Hand out read-only SQLite connections to concurrent readers.
+
+    Connections are opened lazily up to *size* and recycled through a LIFO
+    queue so the most recently used (and therefore warmest) connection is
+    reused first.
+    """
+
+    def __init__(self, path: str, size: int = _READ_POOL_SIZE) -> None:
+        self._uri = f"{Path(path).resolve().as_uri()}?mode=ro"
+        self._size = size
+        # Idle connections; ``None`` is a wake-up token (see :meth:`_release`).
+        self._idle: "queue.LifoQueue[Optional[sqlite3.Connection]]" = queue.LifoQueue()
+        # Connections opened since the last :meth:`close`, idle or checked out.
+        self._opened: Set[sqlite3.Connection] = set()
+        self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._uri,
+            uri=True,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = 1")
+        conn.execute("PRAGMA busy_timeout = 5000")
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    if len(self._opened) < self._size:
+                        conn = self._open()
+                        self._opened.add(conn)
+                        return conn
+                conn = self._idle.get()
+            if conn is not None:
+                return conn
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            if conn in self._opened:
+                self._idle.put(conn)
+                return
+            # Checked out before :meth:`close`; close it instead of recycling
+            # it and wake a reader that may be waiting for a free slot.
+            conn.close()
+            self._idle.put(None)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones are closed on release."""
+
+        with self._lock:
+            self._opened = set()
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except queue.Empty:
+                    break
+                if conn is not None:
+                    conn.close()
 
 
 class ProjectDatabase:
@@ -19,6 +182,11 @@ class ProjectDatabase:
     def __init__(self, path: str | Path | None = None) -> None:
         self._path = self._resolve_path(path)
         self._connection: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.RLock()
+        self._read_pool: Optional[ConnectionPool] = None
+        self._cache: Dict[str, Tuple[str, Project]] = {}
+        if self._path != _MEMORY_PATH:
+            self._read_pool = ConnectionPool(self._path)
 
     # ------------------------------------------------------------------
     # Connection management
@@ -33,28 +201,37 @@ class ProjectDatabase:
             candidate = path.expanduser()
         else:
             candidate = Path(path).expanduser()
-        if str(candidate) != ":memory:":
+        if str(candidate) != _MEMORY_PATH:
             candidate.parent.mkdir(parents=True, exist_ok=True)
         return str(candidate)
 
     def connect(self) -> sqlite3.Connection:
-        if self._connection is None:
-            self._connection = sqlite3.connect(self._path)
-            self._connection.row_factory = sqlite3.Row
-            self._apply_pragmas()
-            self._ensure_schema()
-        return self._connection
-
-    def _apply_pragmas(self) -> None:
         conn = self._connection
         if conn is None:
-            return
-        conn.execute("PRAGMA foreign_keys = ON")
+            with self._write_lock:
+                if self._connection is None:
+                    # Autocommit mode: transactions are opened explicitly in
+                    # :meth:`transaction` instead of by the sqlite3 module.
+                    conn = sqlite3.connect(
+                        self._path,
+                        check_same_thread=False,
+                        isolation_level=None,
+                        cached_statements=_STATEMENT_CACHE_SIZE,
+                    )
+                    conn.row_factory = sqlite3.Row
+                    self._apply_pragmas(conn)
+                    self._ensure_schema(conn)
+                    # Publish only once fully initialised; other threads read
+                    # ``_connection`` without taking the lock.
+                    self._connection = conn
+                conn = self._connection
+        return conn
 
-    def _ensure_schema(self) -> None:
-        conn = self._connection
-        if conn is None:
-            return
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS projects (
@@ -81,10 +258,15 @@ class ProjectDatabase:
             ON projects(status)
             """
         )
-        conn.commit()
 
     def close(self) -> None:
+        if self._read_pool is not None:
+            self._read_pool.close()
         if self._connection is not None:
+            try:
+                self._connection.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
             self._connection.close()
             self._connection = None
 
@@ -96,116 +278,225 @@ class ProjectDatabase:
         self.close()
 
     @contextmanager
-    def transaction(self) -> Iterator[sqlite3.Connection]:
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Yield a connection suitable for read-only queries.
+
+        File-backed databases use the reader pool so lookups do not contend with
+        the writer; in-memory databases only exist on the writer connection.
+        """
+
         conn = self.connect()
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
+        if self._read_pool is None:
+            with self._write_lock:
+                yield conn
+            return
+        with self._read_pool.connection() as reader:
+            yield reader
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Yield the writer connection inside a transaction.
+
+        ``BEGIN IMMEDIATE`` takes the write lock up front: a deferred
+        transaction that reads before writing can fail with ``SQLITE_BUSY``
+        when it upgrades, and ``busy_timeout`` does not retry that.  A failed
+        ``COMMIT`` is rolled back so the connection is usable afterwards.
+        """
+
+        with self._write_lock:
+            conn = self.connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except BaseException:
+                # SQLite may already have rolled back on some errors.
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
 
     # ------------------------------------------------------------------
     # Project CRUD operations
     # ------------------------------------------------------------------
-    def list_projects(self) -> List[Project]:
-        conn = self.connect()
-        cursor = conn.execute("SELECT data FROM projects ORDER BY name ASC")
-        return [self._row_to_project(row) for row in cursor.fetchall()]
+    def list_projects(self, offset: int = 0, limit: Optional[int] = None) -> List[Project]:
+        """Return projects ordered by name, optionally a single page of them.
+
+        Rows whose ``updated_at`` matches the decoded-project cache are copied
+        from it (see :meth:`get_project`), so repeated reloads only decode
+        projects that changed.
+        """
+
+        with self.read() as conn:
+            rows = conn.execute(_SELECT_PAGE_SQL, (-1 if limit is None else limit, offset)).fetchall()
+        return [self._cached_project(row["key"], row) for row in rows]
+
+    def list_projects_with_details(
+        self, offset: int = 0, limit: Optional[int] = None
+    ) -> List[Tuple[Project, Dict[str, Any]]]:
+        """Return ``(project, payload)`` pairs from a single query.
+
+        ``payload`` is the decoded ``data`` column, which has the same shape as
+        :meth:`Project.to_dict`, so callers can use it as the detail view
+        without serialising the project again.
+        """
+
+        with self.read() as conn:
+            rows = conn.execute(_SELECT_PAGE_SQL, (-1 if limit is None else limit, offset)).fetchall()
+        pairs = []
+        for row in rows:
+            payload = _load_payload(row["data"])
+            pairs.append((Project.from_dict(payload), payload))
+        return pairs
+
+    def count_projects(self) -> int:
+        with self.read() as conn:
+            return conn.execute(_COUNT_SQL).fetchone()[0]
 
     def get_project(self, key: str) -> Optional[Project]:
-        conn = self.connect()
-        row = conn.execute("SELECT data FROM projects WHERE key = ?", (key,)).fetchone()
+        """Return the project stored under *key*.
+
+        Decoded projects are cached per ``updated_at`` revision, so repeated
+        lookups of an unchanged row skip decoding.  Each call returns its own
+        :meth:`Project.clone`, so callers may edit the result freely.
+        """
+
+        with self.read() as conn:
+            row = conn.execute(_SELECT_ONE_SQL, (key,)).fetchone()
         if row is None:
+            self._cache.pop(key, None)
             return None
-        return self._row_to_project(row)
+        return self._cached_project(key, row)
 
     def upsert_project(self, project: Project) -> Project:
-        conn = self.connect()
         now = datetime.utcnow()
         existing = self.get_project(project.key)
         if project.created_at is None:
             project.created_at = existing.created_at if existing else now
         project.updated_at = now
-        payload = project.to_dict()
-        data_json = json.dumps(payload, ensure_ascii=False, sort_keys=True)
         with self.transaction() as txn:
-            txn.execute(
-                """
-                INSERT INTO projects (
-                    key, name, icon, default_profile, last_profile, summary, tags,
-                    status, favorite, active, usage_hours, data, created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(key) DO UPDATE SET
-                    name=excluded.name,
-                    icon=excluded.icon,
-                    default_profile=excluded.default_profile,
-                    last_profile=excluded.last_profile,
-                    summary=excluded.summary,
-                    tags=excluded.tags,
-                    status=excluded.status,
-                    favorite=excluded.favorite,
-                    active=excluded.active,
-                    usage_hours=excluded.usage_hours,
-                    data=excluded.data,
-                    updated_at=excluded.updated_at
-                """,
-                (
-                    project.key,
-                    project.name,
-                    project.icon,
-                    project.default_profile,
-                    project.last_profile,
-                    project.summary,
-                    project.tags_as_text,
-                    project.status,
-                    int(project.favorite),
-                    int(project.active),
-                    project.usage_hours,
-                    data_json,
-                    project.created_at.isoformat(),
-                    project.updated_at.isoformat(),
-                ),
-            )
+            txn.execute(_UPSERT_SQL, self._build_row_tuple(project))
+        self._cache.pop(project.key, None)
         return project
 
     def delete_project(self, key: str) -> bool:
-        conn = self.connect()
         with self.transaction() as txn:
-            cursor = txn.execute("DELETE FROM projects WHERE key = ?", (key,))
+            cursor = txn.execute(_DELETE_SQL, (key,))
+        self._cache.pop(key, None)
         return cursor.rowcount > 0
 
     def set_favorite(self, key: str, is_favorite: bool) -> Optional[Project]:
-        project = self.get_project(key)
-        if not project:
-            return None
-        project.set_favorite(is_favorite)
-        return self.upsert_project(project)
+        now = datetime.utcnow().isoformat()
+        return self._update_returning(
+            key,
+            _SET_FAVORITE_SQL,
+            (int(bool(is_favorite)), "true" if is_favorite else "false", now, now, key),
+        )
 
     def update_last_profile(self, key: str, profile: str) -> Optional[Project]:
-        project = self.get_project(key)
-        if not project:
-            return None
-        project.last_profile = profile
-        return self.upsert_project(project)
+        now = datetime.utcnow().isoformat()
+        return self._update_returning(
+            key,
+            _UPDATE_LAST_PROFILE_SQL,
+            (profile, profile, now, now, key),
+        )
 
     def record_history(self, key: str, description: str, timestamp: Optional[str] = None) -> Optional[Project]:
-        project = self.get_project(key)
-        if not project:
-            return None
-        project.add_history(description, timestamp)
-        return self.upsert_project(project)
+        if timestamp is None:
+            timestamp = datetime.now().strftime("%H:%M")
+        now = datetime.utcnow().isoformat()
+        return self._update_returning(
+            key,
+            _RECORD_HISTORY_SQL,
+            (timestamp, description, now, now, key),
+        )
+
+    def upsert_projects(self, projects: Iterable[Project]) -> List[Project]:
+        """Insert or update *projects* in a single transaction.
+
+        Existing rows keep their original ``created_at``. It is read for all
+        keys with one query and copied onto the returned projects, so they
+        match what is stored.
+        """
+
+        saved = list(projects)
+        if not saved:
+            return saved
+        now = datetime.utcnow()
+        keys = json.dumps([project.key for project in saved])
+        with self.transaction() as txn:
+            stored = dict(txn.execute(_SELECT_CREATED_AT_SQL, (keys,)).fetchall())
+            rows = []
+            for project in saved:
+                created_at = stored.get(project.key)
+                if created_at is not None:
+                    project.created_at = datetime.fromisoformat(created_at)
+                elif project.created_at is None:
+                    project.created_at = now
+                project.updated_at = now
+                rows.append(self._build_row_tuple(project))
+            txn.executemany(_UPSERT_SQL, rows)
+        for project in saved:
+            self._cache.pop(project.key, None)
+        return saved
 
     def bulk_import(self, projects: Iterable[Project]) -> None:
-        for project in projects:
-            self.upsert_project(project)
+        self.upsert_projects(projects)
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
+    def _update_returning(self, key: str, sql: str, params: Tuple[Any, ...]) -> Optional[Project]:
+        """Run a single-row ``UPDATE ... RETURNING data`` and decode the result."""
+
+        with self.transaction() as txn:
+            row = txn.execute(sql, params).fetchone()
+        self._cache.pop(key, None)
+        if row is None:
+            return None
+        return self._row_to_project(row)
+
+    @staticmethod
+    def _build_row_tuple(project: Project) -> Tuple[Any, ...]:
+        # orjson writes non-finite floats as ``null``, which would not load back.
+        if not math.isfinite(project.usage_hours):
+            raise ValueError(f"usage_hours must be finite, got {project.usage_hours!r}")
+        payload = project.to_dict()
+        data_json = _dump_payload(payload)
+        return (
+            project.key,
+            project.name,
+            project.icon,
+            project.default_profile,
+            project.last_profile,
+            project.summary,
+            project.tags_as_text,
+            project.status,
+            int(project.favorite),
+            int(project.active),
+            project.usage_hours,
+            data_json,
+            payload["createdAt"],
+            payload["updatedAt"],
+        )
+
+    def _cached_project(self, key: str, row: sqlite3.Row) -> Project:
+        """Return a copy of the cached project for *row*, decoding it if the revision changed.
+
+        The cached instance itself is never handed out, so edits made by
+        callers cannot leak into later reads.
+        """
+
+        updated_at = row["updated_at"]
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == updated_at and cached[1].key == key:
+            return cached[1].clone()
+        project = self._row_to_project(row)
+        self._cache[key] = (updated_at, project)
+        return project.clone()
+
     @staticmethod
     def _row_to_project(row: sqlite3.Row) -> Project:
-        payload = json.loads(row["data"])
+        payload = _load_payload(row["data"])
         return Project.from_dict(payload)
 
 
@@ -2,26 +2,38 @@
 
 from __future__ import annotations
 
+import time
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from PySide6.QtCore import QObject, Slot
 
 from .project import Component, Project
 
+_STATUS_RUNNING = 1
+_STATUS_PAUSED = 2
+_STATUS_STOPPED = 4
+_STATUS_OTHER = 8
 
-def _timestamp() -> str:
-    """Return the current time formatted for log entries."""
 
-    return datetime.now().strftime("%H:%M")
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
 
+def _timestamp() -> str:
+    """Return the current time formatted for log entries.
 
-def _limit(entries: List[str], maximum: int = 100) -> List[str]:
-    """Return the last *maximum* entries from *entries*."""
+    The text only changes once a minute, so the formatted value is reused until
+    the minute rolls over instead of calling ``strftime`` for every entry.
+    """
 
-    if len(entries) <= maximum:
-        return entries
-    return entries[-maximum:]
+    global _timestamp_cache
+    now = time.time()
+    minute = int(now // 60)
+    cached_minute, text = _timestamp_cache
+    if minute != cached_minute:
+        text = datetime.fromtimestamp(now).strftime("%H:%M")
+        _timestamp_cache = (minute, text)
+    return text
 
 
 class LaunchService(QObject):
@@ -30,6 +42,9 @@ class LaunchService(QObject):
     def __init__(self, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
         self._projects: Dict[str, Project] = {}
+        self._sorted_keys: List[str] = []
+        self._overview_cache: Dict[str, Dict[str, Any]] = {}
+        self._detail_cache: Dict[str, Dict[str, Any]] = {}
         self._load_initial_state()
 
     # ------------------------------------------------------------------
@@ -39,27 +54,27 @@ class LaunchService(QObject):
     def project_overview(self) -> List[Dict[str, Any]]:
         """Return an overview payload for all configured projects."""
 
-        return [project.to_overview() for project in self._iter_projects()]
+        return [self._overview(project) for project in self._iter_projects()]
 
     @Slot(result="QVariantMap")
     def project_details(self) -> Dict[str, Dict[str, Any]]:
         """Return the detailed payload for every project keyed by slug."""
 
-        return {project.key: project.to_dict() for project in self._iter_projects()}
+        return {project.key: self._detail(project) for project in self._iter_projects()}
 
     @Slot(str, result="QVariantMap")
     def project_detail(self, project_key: str) -> Dict[str, Any]:
         """Return the detail payload for *project_key* if it exists."""
 
         project = self._projects.get(project_key)
-        return project.to_dict() if project else {}
+        return self._detail(project) if project else {}
 
     @Slot(str, result="QVariantMap")
     def project_overview_for(self, project_key: str) -> Dict[str, Any]:
         """Return a single project overview entry."""
 
         project = self._projects.get(project_key)
-        return project.to_overview() if project else {}
+        return self._overview(project) if project else {}
 
     @Slot(str, str, result="QVariantMap")
     def launch_project(self, project_key: str, profile: str = "") -> Dict[str, Any]:
@@ -105,7 +120,23 @@ class LaunchService(QObject):
     # Internal helpers
     # ------------------------------------------------------------------
     def _iter_projects(self) -> Iterable[Project]:
-        return sorted(self._projects.values(), key=lambda project: project.name.lower())
+        return [self._projects[key] for key in self._sorted_keys]
+
+    def _add_project(self, project: Project) -> None:
+        self._projects[project.key] = project
+        self._sorted_keys = sorted(self._projects, key=lambda key: self._projects[key].name.casefold())
+
+    def _overview(self, project: Project) -> Dict[str, Any]:
+        overview = self._overview_cache.get(project.key)
+        if overview is None:
+            overview = self._overview_cache[project.key] = project.to_overview()
+        return overview
+
+    def _detail(self, project: Project) -> Dict[str, Any]:
+        detail = self._detail_cache.get(project.key)
+        if detail is None:
+            detail = self._detail_cache[project.key] = project.to_dict()
+        return detail
 
     def _component_action(self, project_key: str, component_name: str, action: str) -> Dict[str, Any]:
         project = self._projects.get(project_key)
@@ -141,44 +172,54 @@ class LaunchService(QObject):
         component.status = status
         component.status_detail = detail
         log_entry = f"[{_timestamp()}] {status}: {detail}"
-        component.logs = _limit([*component.logs, log_entry])
+        component.logs.append(log_entry)
 
     def _find_component(self, project: Project, component_name: str) -> Optional[Component]:
-        for component in project.components:
-            if component.name == component_name:
-                return component
-        return None
+        return project.find_component(component_name)
 
     def _finalise_project_update(self, project: Project) -> None:
         project.status = self._derive_project_status(project)
         project.active = project.status in {"Running", "Paused"}
         project.touch()
+        self._overview_cache.pop(project.key, None)
+        self._detail_cache.pop(project.key, None)
 
     def _derive_project_status(self, project: Project) -> str:
-        statuses = [component.status.lower() for component in project.components]
-        if not statuses:
+        components = project.components
+        if not components:
             return "Ready"
-        if any("fail" in status or "error" in status for status in statuses):
-            return "Needs Attention"
-        if any("running" in status for status in statuses):
+        flags = 0
+        for component in components:
+            status = component.status.lower()
+            if "fail" in status or "error" in status:
+                return "Needs Attention"
+            if "running" in status:
+                flags |= _STATUS_RUNNING
+            elif "paused" in status:
+                flags |= _STATUS_PAUSED
+            elif "stopped" in status:
+                flags |= _STATUS_STOPPED
+            else:
+                flags |= _STATUS_OTHER
+        if flags & _STATUS_RUNNING:
             return "Running"
-        if any("paused" in status for status in statuses):
+        if flags & _STATUS_PAUSED:
             return "Paused"
-        if all("stopped" in status for status in statuses):
+        if flags == _STATUS_STOPPED:
             return "Stopped"
         return "Ready"
 
     def _result_payload(self, project: Project) -> Dict[str, Any]:
-        return {"project": project.to_dict(), "overview": project.to_overview()}
+        return {"project": self._detail(project), "overview": self._overview(project)}
 
     def _load_initial_state(self) -> None:
         now = datetime.utcnow()
-        for payload in _SAMPLE_PROJECTS:
-            project = Project.from_dict(payload)
+        for prototype in _SAMPLE_PROTOTYPES:
+            project = prototype.clone()
             project.created_at = now
             project.updated_at = now
             self._finalise_project_update(project)
-            self._projects[project.key] = project
+            self._add_project(project)
 
 
 _SAMPLE_PROJECTS: List[Dict[str, Any]] = [
@@ -408,5 +449,7 @@ _SAMPLE_PROJECTS: List[Dict[str, Any]] = [
     },
 ]
 
+_SAMPLE_PROTOTYPES = tuple(Project.from_dict(payload) for payload in _SAMPLE_PROJECTS)
+
 
 __all__ = ["LaunchService"]
@@ -1,10 +1,26 @@
 """Data model definitions for LaunchPad projects."""
 from __future__ import annotations
 
+import sys
+from collections import deque
 from collections.abc import Iterable as IterableABC, Mapping as MappingABC
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple
+
+_LOG_LIMIT = 100
+# Keys of :meth:`Project.to_dict` that make up the overview payload.
+_OVERVIEW_FIELDS = (
+    "key",
+    "name",
+    "icon",
+    "lastProfile",
+    "tags",
+    "status",
+    "favorite",
+    "active",
+    "usageHours",
+)
 
 
 def _normalize_sequence(value: Any) -> List[Any]:
@@ -16,6 +32,13 @@ def _normalize_sequence(value: Any) -> List[Any]:
     converted into an empty list.
     """
 
+    value_type = type(value)
+    if value_type is list:
+        # Already a list (the common case for decoded JSON); callers copy it
+        # before storing, so it is returned as-is.
+        return value
+    if value_type is tuple:
+        return list(value)
     if value is None:
         return []
     if isinstance(value, str):
@@ -23,11 +46,60 @@ def _normalize_sequence(value: Any) -> List[Any]:
     if isinstance(value, MappingABC):
         return [value]
     if isinstance(value, IterableABC):
-        return [item for item in value]
+        return list(value)
     return [value]
 
 
-@dataclass
+def _intern_strings(values: List[Any]) -> Tuple[Any, ...]:
+    """Return *values* as a tuple with every string interned.
+
+    Like statuses and profile names, tags come from a small vocabulary, so
+    interning lets every project share one object per distinct value.
+    """
+
+    return tuple(sys.intern(value) if type(value) is str else value for value in values)
+
+
+def _parse_timestamp(value: Any) -> Tuple[Optional[datetime], Optional[str]]:
+    """Return ``(datetime, text)`` for an ISO timestamp, or ``(None, None)`` if unset.
+
+    Raises :class:`ValueError` when *value* is not a valid ISO timestamp.
+    """
+
+    if not value:
+        return None, None
+    text = str(value)
+    return datetime.fromisoformat(text), text
+
+
+def _timestamp_text(
+    value: Optional[datetime], cached: Optional[Tuple[Optional[datetime], Optional[str]]]
+) -> Tuple[Optional[datetime], Optional[str]]:
+    """Return ``(value, ISO text)``, reusing *cached* while it still holds *value*."""
+
+    if cached is not None and cached[0] is value:
+        return cached
+    return value, value.isoformat() if value is not None else None
+
+
+def _build_records(items: Any, record_type: Any) -> List[Any]:
+    """Return *items* as *record_type* instances, decoding mappings on the way.
+
+    Entries that are neither mappings nor *record_type* instances are dropped.
+    """
+
+    records = []
+    for item in items:
+        if type(item) is dict:
+            records.append(record_type.from_dict(item))
+        elif isinstance(item, record_type):
+            records.append(item)
+        elif isinstance(item, MappingABC):
+            records.append(record_type.from_dict(item))
+    return records
+
+
+@dataclass(slots=True)
 class HealthCheck:
     """Status information about a component or project."""
 
@@ -46,12 +118,12 @@ class HealthCheck:
     def from_dict(cls, payload: Mapping[str, Any]) -> "HealthCheck":
         return cls(
             label=str(payload.get("label", "")),
-            status=str(payload.get("status", "")),
+            status=sys.intern(str(payload.get("status", ""))),
             detail=str(payload.get("detail", "")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class QuickLink:
     """Represents a quick access link for a project."""
 
@@ -69,7 +141,7 @@ class QuickLink:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FolderLink:
     """Represents a folder shortcut displayed in the UI."""
 
@@ -87,7 +159,7 @@ class FolderLink:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoryEvent:
     """Represents a single entry in the project activity log."""
 
@@ -105,7 +177,7 @@ class HistoryEvent:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Component:
     """Represents one component in a LaunchPad project."""
 
@@ -113,9 +185,13 @@ class Component:
     status: str
     summary: str = ""
     status_detail: str = ""
-    logs: List[str] = field(default_factory=list)
+    logs: Deque[str] = field(default_factory=lambda: deque(maxlen=_LOG_LIMIT))
     health_checks: List[HealthCheck] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.logs, deque) or self.logs.maxlen != _LOG_LIMIT:
+            self.logs = deque(self.logs, maxlen=_LOG_LIMIT)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "name": self.name,
@@ -126,26 +202,34 @@ class Component:
             "healthChecks": [check.to_dict() for check in self.health_checks],
         }
 
+    def clone(self) -> "Component":
+        """Return a copy whose status, logs and health checks can change independently."""
+
+        return Component(
+            name=self.name,
+            status=self.status,
+            summary=self.summary,
+            status_detail=self.status_detail,
+            logs=deque(self.logs, maxlen=_LOG_LIMIT),
+            health_checks=list(self.health_checks),
+        )
+
     @classmethod
     def from_dict(cls, payload: Mapping[str, Any]) -> "Component":
         logs = _normalize_sequence(payload.get("logs"))
         health_data = payload.get("healthChecks", [])
-        health_checks = [
-            HealthCheck.from_dict(item)
-            for item in _normalize_sequence(health_data)
-            if isinstance(item, MappingABC)
-        ]
+        health_checks = _build_records(_normalize_sequence(health_data), HealthCheck)
         return cls(
             name=str(payload.get("name", "")),
-            status=str(payload.get("status", "")),
+            status=sys.intern(str(payload.get("status", ""))),
             summary=str(payload.get("summary", "")),
             status_detail=str(payload.get("statusDetail", payload.get("status_detail", ""))),
-            logs=[str(item) for item in logs],
+            logs=deque(map(str, logs), maxlen=_LOG_LIMIT),
             health_checks=health_checks,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Data class describing a LaunchPad project and its metadata."""
 
@@ -154,7 +238,7 @@ class Project:
     icon: str = "📁"
     default_profile: str = "dev"
     summary: str = ""
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = ()
     status: str = "Ready"
     favorite: bool = False
     active: bool = False
@@ -167,12 +251,29 @@ class Project:
     health_checks: List[HealthCheck] = field(default_factory=list)
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # ``(timestamp, ISO text)`` backing :meth:`to_dict`; seeded by
+    # :meth:`from_dict` so loaded timestamps are written back verbatim.
+    _created_at_text: Optional[Tuple[Optional[datetime], Optional[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _updated_at_text: Optional[Tuple[Optional[datetime], Optional[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _component_index: Dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # ``(tags, joined text)`` backing :attr:`tags_as_text`.
+    _tags_text: Optional[Tuple[Tuple[str, ...], str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         if self.last_profile is None:
             self.last_profile = self.default_profile
-        self.tags = [tag for tag in _normalize_sequence(self.tags)]
+        if type(self.tags) is not tuple:
+            self.tags = tuple(_normalize_sequence(self.tags))
         self.usage_hours = float(self.usage_hours)
+        self._reindex_components()
 
     # ------------------------------------------------------------------
     # Serialization helpers
@@ -198,10 +299,12 @@ class Project:
             "history": [event.to_dict() for event in self.history],
             "healthChecks": [check.to_dict() for check in self.health_checks],
         }
-        if self.created_at is not None:
-            payload["createdAt"] = self.created_at.isoformat()
-        if self.updated_at is not None:
-            payload["updatedAt"] = self.updated_at.isoformat()
+        created = self._created_at_text = _timestamp_text(self.created_at, self._created_at_text)
+        if created[1] is not None:
+            payload["createdAt"] = created[1]
+        updated = self._updated_at_text = _timestamp_text(self.updated_at, self._updated_at_text)
+        if updated[1] is not None:
+            payload["updatedAt"] = updated[1]
         return payload
 
     def to_overview(self) -> Dict[str, Any]:
@@ -219,11 +322,48 @@ class Project:
             "usageHours": self.usage_hours,
         }
 
+    def to_payload(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Return ``(overview, detail)`` built from a single :meth:`to_dict` walk.
+
+        The overview shares its values (including the tags list) with the
+        detail payload, so neither should be mutated by callers.
+        """
+
+        detail = self.to_dict()
+        overview = {name: detail[name] for name in _OVERVIEW_FIELDS}
+        return overview, detail
+
     @property
     def tags_as_text(self) -> str:
-        """Return the project tags as a comma separated string."""
-
-        return ", ".join(self.tags)
+        """Return the project tags as a comma separated string.
+
+        The joined text is cached until ``tags`` is reassigned.
+        """
+
+        tags = self.tags
+        cached = self._tags_text
+        if cached is None or cached[0] is not tags:
+            cached = self._tags_text = (tags, ", ".join(tags))
+        return cached[1]
+
+    def clone(self) -> "Project":
+        """Return a copy that shares no mutable state with this project.
+
+        The leaf link/history/health-check records are never mutated in place,
+        so only the containers holding them are copied.
+        """
+
+        copy = replace(
+            self,
+            components=[component.clone() for component in self.components],
+            quick_links=list(self.quick_links),
+            folders=list(self.folders),
+            history=list(self.history),
+            health_checks=list(self.health_checks),
+        )
+        copy._created_at_text = self._created_at_text
+        copy._updated_at_text = self._updated_at_text
+        return copy
 
     @classmethod
     def from_dict(cls, payload: Mapping[str, Any]) -> "Project":
@@ -236,59 +376,32 @@ class Project:
         history_raw = payload.get("history", [])
         health_checks_raw = payload.get("healthChecks", [])
 
-        created_at = payload.get("createdAt")
-        updated_at = payload.get("updatedAt")
+        created = _parse_timestamp(payload.get("createdAt"))
+        updated = _parse_timestamp(payload.get("updatedAt"))
 
-        return cls(
+        project = cls(
             key=str(payload.get("key", "")),
             name=str(payload.get("name", "")),
             icon=str(payload.get("icon", "📁")),
-            default_profile=str(payload.get("defaultProfile", payload.get("default_profile", "dev"))),
+            default_profile=sys.intern(str(payload.get("defaultProfile", payload.get("default_profile", "dev")))),
             last_profile=payload.get("lastProfile", payload.get("last_profile")),
             summary=str(payload.get("summary", "")),
-            tags=_normalize_sequence(tags),
-            status=str(payload.get("status", "Ready")),
+            tags=_intern_strings(_normalize_sequence(tags)),
+            status=sys.intern(str(payload.get("status", "Ready"))),
             favorite=bool(payload.get("favorite", False)),
             active=bool(payload.get("active", False)),
-            usage_hours=float(payload.get("usageHours", payload.get("usage_hours", 0.0))),
-            components=[
-                component
-                if isinstance(component, Component)
-                else Component.from_dict(component)
-                for component in components_raw
-                if isinstance(component, (MappingABC, Component))
-            ],
-            quick_links=[
-                link
-                if isinstance(link, QuickLink)
-                else QuickLink.from_dict(link)
-                for link in quick_links_raw
-                if isinstance(link, (MappingABC, QuickLink))
-            ],
-            folders=[
-                folder
-                if isinstance(folder, FolderLink)
-                else FolderLink.from_dict(folder)
-                for folder in folders_raw
-                if isinstance(folder, (MappingABC, FolderLink))
-            ],
-            history=[
-                event
-                if isinstance(event, HistoryEvent)
-                else HistoryEvent.from_dict(event)
-                for event in history_raw
-                if isinstance(event, (MappingABC, HistoryEvent))
-            ],
-            health_checks=[
-                check
-                if isinstance(check, HealthCheck)
-                else HealthCheck.from_dict(check)
-                for check in health_checks_raw
-                if isinstance(check, (MappingABC, HealthCheck))
-            ],
-            created_at=datetime.fromisoformat(created_at) if created_at else None,
-            updated_at=datetime.fromisoformat(updated_at) if updated_at else None,
+            usage_hours=float(payload.get("usageHours", payload.get("usage_hours", 0.0)) or 0.0),
+            components=_build_records(components_raw, Component),
+            quick_links=_build_records(quick_links_raw, QuickLink),
+            folders=_build_records(folders_raw, FolderLink),
+            history=_build_records(history_raw, HistoryEvent),
+            health_checks=_build_records(health_checks_raw, HealthCheck),
+            created_at=created[0],
+            updated_at=updated[0],
         )
+        project._created_at_text = created
+        project._updated_at_text = updated
+        return project
 
     # ------------------------------------------------------------------
     # Domain helpers
@@ -308,15 +421,43 @@ class Project:
 
         self.updated_at = datetime.utcnow()
 
+    def find_component(self, name: str) -> Optional[Component]:
+        """Return the component called *name*, if any."""
+
+        index = self._component_position(name)
+        return None if index is None else self.components[index]
+
     def ensure_component(self, component: Component) -> None:
         """Add or replace a component with the same name."""
 
-        for index, existing in enumerate(self.components):
-            if existing.name == component.name:
-                self.components[index] = component
-                break
-        else:
+        index = self._component_position(component.name)
+        if index is None:
+            self._component_index[component.name] = len(self.components)
             self.components.append(component)
+        else:
+            self.components[index] = component
+
+    def _component_position(self, name: str) -> Optional[int]:
+        index = self._component_index.get(name)
+        components = self.components
+        if index is not None and index < len(components) and components[index].name == name:
+            return index
+        # Miss or stale entry: ``components`` may have been replaced or a
+        # component renamed directly, so fall back to a scan and rebuild.
+        for position, component in enumerate(components):
+            if component.name == name:
+                self._reindex_components()
+                return position
+        if index is not None:
+            self._reindex_components()
+        return None
+
+    def _reindex_components(self) -> None:
+        # Iterate in reverse so the first of any duplicate names wins, matching
+        # a linear scan.
+        self._component_index = {
+            self.components[index].name: index for index in range(len(self.components) - 1, -1, -1)
+        }
 
 
 __all__ = [
@@ -0,0 +1,63 @@
+"""Roles and background loading shared by the LaunchPad project models."""
+from __future__ import annotations
+
+import logging
+import re
+from typing import Any, Callable, Dict
+
+from PySide6.QtCore import QObject, QRunnable, Qt, Signal
+
+_LOGGER = logging.getLogger(__name__)
+
+TAG_SPLIT = re.compile(r"\s*,\s*")
+
+KEY_ROLE = int(Qt.UserRole) + 1
+NAME_ROLE = int(Qt.UserRole) + 2
+ICON_ROLE = int(Qt.UserRole) + 3
+LAST_PROFILE_ROLE = int(Qt.UserRole) + 4
+TAGS_ROLE = int(Qt.UserRole) + 5
+STATUS_ROLE = int(Qt.UserRole) + 6
+FAVORITE_ROLE = int(Qt.UserRole) + 7
+ACTIVE_ROLE = int(Qt.UserRole) + 8
+USAGE_HOURS_ROLE = int(Qt.UserRole) + 9
+
+# Shared by every model instance; never mutated.
+ROLE_NAMES: Dict[int, bytes] = {
+    KEY_ROLE: b"key",
+    NAME_ROLE: b"name",
+    ICON_ROLE: b"icon",
+    LAST_PROFILE_ROLE: b"lastProfile",
+    TAGS_ROLE: b"tags",
+    STATUS_ROLE: b"status",
+    FAVORITE_ROLE: b"favorite",
+    ACTIVE_ROLE: b"active",
+    USAGE_HOURS_ROLE: b"usageHours",
+}
+
+
+class LoadSignals(QObject):
+    finished = Signal(object)
+
+
+class LoadTask(QRunnable):
+    """Run *load* off the GUI thread and emit its result via ``signals.finished``.
+
+    A result is always reported: if *load* raises, the error is logged and
+    *fallback* is emitted instead, so models waiting on the load still settle.
+    Connect ``finished`` to a ``@Slot`` so the result is delivered on the
+    receiver's thread.
+    """
+
+    def __init__(self, load: Callable[[], Any], fallback: Any) -> None:
+        super().__init__()
+        self._load = load
+        self._fallback = fallback
+        self.signals = LoadSignals()
+
+    def run(self) -> None:
+        try:
+            result = self._load()
+        except Exception:
+            _LOGGER.exception("Failed to load projects")
+            result = self._fallback
+        self.signals.finished.emit(result)
@@ -1,44 +1,75 @@
 """Qt list model exposing :class:`~core.project.Project` instances to QML."""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import math
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Set
 
-from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt, Slot
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    Qt,
+    QThreadPool,
+    Slot,
+)
 
 from core.database import ProjectDatabase
 from core.project import Project
+from gui._model_common import (
+    ACTIVE_ROLE,
+    FAVORITE_ROLE,
+    ICON_ROLE,
+    KEY_ROLE,
+    LAST_PROFILE_ROLE,
+    NAME_ROLE,
+    ROLE_NAMES,
+    STATUS_ROLE,
+    TAG_SPLIT,
+    TAGS_ROLE,
+    USAGE_HOURS_ROLE,
+    LoadTask,
+)
 
 
 class ProjectListModel(QAbstractListModel):
     """Expose project overview information to Qt's model/view layer."""
 
-    KeyRole = Qt.UserRole + 1
-    NameRole = Qt.UserRole + 2
-    IconRole = Qt.UserRole + 3
-    LastProfileRole = Qt.UserRole + 4
-    TagsRole = Qt.UserRole + 5
-    StatusRole = Qt.UserRole + 6
-    FavoriteRole = Qt.UserRole + 7
-    ActiveRole = Qt.UserRole + 8
-    UsageHoursRole = Qt.UserRole + 9
-
-    _ROLE_NAMES = {
-        KeyRole: b"key",
-        NameRole: b"name",
-        IconRole: b"icon",
-        LastProfileRole: b"lastProfile",
-        TagsRole: b"tags",
-        StatusRole: b"status",
-        FavoriteRole: b"favorite",
-        ActiveRole: b"active",
-        UsageHoursRole: b"usageHours",
+    KeyRole = KEY_ROLE
+    NameRole = NAME_ROLE
+    IconRole = ICON_ROLE
+    LastProfileRole = LAST_PROFILE_ROLE
+    TagsRole = TAGS_ROLE
+    StatusRole = STATUS_ROLE
+    FavoriteRole = FAVORITE_ROLE
+    ActiveRole = ACTIVE_ROLE
+    UsageHoursRole = USAGE_HOURS_ROLE
+
+    # Role -> accessor returning the value exposed for that role.
+    _ROLE_GETTERS = {
+        Qt.DisplayRole: attrgetter("name"),
+        KeyRole: attrgetter("key"),
+        NameRole: attrgetter("name"),
+        IconRole: attrgetter("icon"),
+        LastProfileRole: attrgetter("last_profile"),
+        TagsRole: attrgetter("tags_as_text"),
+        StatusRole: attrgetter("status"),
+        FavoriteRole: attrgetter("favorite"),
+        ActiveRole: attrgetter("active"),
+        UsageHoursRole: attrgetter("usage_hours"),
     }
 
     def __init__(self, database: ProjectDatabase, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
         self._database = database
         self._projects: List[Project] = []
-        self.refresh()
+        self._index: Dict[str, Project] = {}
+        self._overview_cache: Dict[str, Dict[str, Any]] = {}
+        self._batch_depth = 0
+        # Rows edited inside a batch, mapped to the roles that changed.
+        self._batch_dirty: Dict[int, Set[int]] = {}
+        self._load_task: Optional[LoadTask] = None
+        self._load_initial_projects()
 
     # ------------------------------------------------------------------
     # Qt model API
@@ -54,29 +85,13 @@ class ProjectListModel(QAbstractListModel):
         row = index.row()
         if row < 0 or row >= len(self._projects):
             return None
-        project = self._projects[row]
-        if role in (Qt.DisplayRole, ProjectListModel.NameRole):
-            return project.name
-        if role == ProjectListModel.KeyRole:
-            return project.key
-        if role == ProjectListModel.IconRole:
-            return project.icon
-        if role == ProjectListModel.LastProfileRole:
-            return project.last_profile
-        if role == ProjectListModel.TagsRole:
-            return project.tags
-        if role == ProjectListModel.StatusRole:
-            return project.status
-        if role == ProjectListModel.FavoriteRole:
-            return project.favorite
-        if role == ProjectListModel.ActiveRole:
-            return project.active
-        if role == ProjectListModel.UsageHoursRole:
-            return project.usage_hours
-        return None
+        getter = ProjectListModel._ROLE_GETTERS.get(role)
+        if getter is None:
+            return None
+        return getter(self._projects[row])
 
     def roleNames(self) -> Dict[int, bytes]:  # type: ignore[override]
-        return dict(ProjectListModel._ROLE_NAMES)
+        return dict(ROLE_NAMES)
 
     def flags(self, index: QModelIndex) -> Qt.ItemFlags:  # type: ignore[override]
         base_flags = super().flags(index)
@@ -92,55 +107,63 @@ class ProjectListModel(QAbstractListModel):
             return False
 
         project = self._projects[row]
+        # QML bindings often write back the value they just read; skip those
+        # before any coercion. Tags are compared in their joined text form.
+        getter = ProjectListModel._ROLE_GETTERS.get(role)
+        if getter is None or value == getter(project):
+            return False
+        previous_key = project.key
         changed = False
 
-        if role == ProjectListModel.KeyRole:
+        if role == KEY_ROLE:
             new_value = str(value)
             if new_value and new_value != project.key:
+                if self._index.get(project.key) is project:
+                    del self._index[project.key]
                 project.key = new_value
+                self._index[new_value] = project
                 changed = True
-        elif role == ProjectListModel.NameRole:
+        elif role == NAME_ROLE:
             new_value = str(value)
             if new_value != project.name:
                 project.name = new_value
                 changed = True
-        elif role == ProjectListModel.IconRole:
+        elif role == ICON_ROLE:
             new_value = str(value)
             if new_value != project.icon:
                 project.icon = new_value
                 changed = True
-        elif role == ProjectListModel.LastProfileRole:
+        elif role == LAST_PROFILE_ROLE:
             new_value = str(value)
             if new_value != project.last_profile:
                 project.last_profile = new_value
                 changed = True
-        elif role == ProjectListModel.TagsRole:
-            text = str(value)
-            tags = [item.strip() for item in text.split(",") if item.strip()]
+        elif role == TAGS_ROLE:
+            tags = tuple(filter(None, TAG_SPLIT.split(str(value).strip())))
             if tags != project.tags:
                 project.tags = tags
                 changed = True
-        elif role == ProjectListModel.StatusRole:
+        elif role == STATUS_ROLE:
             new_value = str(value)
             if new_value != project.status:
                 project.status = new_value
                 changed = True
-        elif role == ProjectListModel.FavoriteRole:
+        elif role == FAVORITE_ROLE:
             new_value = bool(value)
             if new_value != project.favorite:
                 project.favorite = new_value
                 changed = True
-        elif role == ProjectListModel.ActiveRole:
+        elif role == ACTIVE_ROLE:
             new_value = bool(value)
             if new_value != project.active:
                 project.active = new_value
                 changed = True
-        elif role == ProjectListModel.UsageHoursRole:
+        elif role == USAGE_HOURS_ROLE:
             try:
                 new_value = float(value)
             except (TypeError, ValueError):
                 new_value = project.usage_hours
-            if new_value != project.usage_hours:
+            if new_value != project.usage_hours and math.isfinite(new_value):
                 project.usage_hours = new_value
                 changed = True
         else:
@@ -150,6 +173,10 @@ class ProjectListModel(QAbstractListModel):
         if not changed:
             return False
 
+        self._overview_cache.pop(previous_key, None)
+        if self._batch_depth > 0:
+            self._batch_dirty.setdefault(row, set()).add(role)
+            return True
         self._database.upsert_project(project)
         self.dataChanged.emit(index, index, [role])
         return True
@@ -158,17 +185,53 @@ class ProjectListModel(QAbstractListModel):
     # Data management helpers
     # ------------------------------------------------------------------
     def refresh(self) -> None:
+        # Edits made inside an open batch must reach the database before it is
+        # read back; the reset below makes per-row notifications unnecessary.
+        self._save_dirty_rows()
+        # A synchronous reload supersedes a startup load still in flight.
+        self._load_task = None
+        self._set_projects(self._database.list_projects())
+
+    def _set_projects(self, projects: List[Project]) -> None:
         self.beginResetModel()
-        self._projects = self._database.list_projects()
+        self._projects = projects
+        self._index = {project.key: project for project in self._projects}
+        self._overview_cache.clear()
         self.endResetModel()
 
+    def _load_initial_projects(self) -> None:
+        """Read the projects on a worker thread so the first frame is not delayed."""
+
+        self._load_task = LoadTask(self._database.list_projects, [])
+        self._load_task.signals.finished.connect(self._on_initial_load_finished)
+        QThreadPool.globalInstance().start(self._load_task)
+
+    @Slot(object)
+    def _on_initial_load_finished(self, projects: List[Project]) -> None:
+        if self._load_task is None:
+            return
+        self._load_task = None
+        self._set_projects(projects)
+
+    def _save_dirty_rows(self) -> Dict[int, Set[int]]:
+        dirty, self._batch_dirty = self._batch_dirty, {}
+        if dirty:
+            self._database.upsert_projects(self._projects[row] for row in sorted(dirty))
+        return dirty
+
     def _project_overview(self, project: Project) -> Dict[str, Any]:
+        overview = self._overview_cache.get(project.key)
+        if overview is None:
+            overview = self._overview_cache[project.key] = self._build_overview(project)
+        return overview
+
+    def _build_overview(self, project: Project) -> Dict[str, Any]:
         return {
             "key": project.key,
             "name": project.name,
             "icon": project.icon,
             "lastProfile": project.last_profile,
-            "tags": project.tags,
+            "tags": project.tags_as_text,
             "status": project.status,
             "favorite": project.favorite,
             "active": project.active,
@@ -176,10 +239,7 @@ class ProjectListModel(QAbstractListModel):
         }
 
     def _project_by_key(self, key: str) -> Optional[Project]:
-        for project in self._projects:
-            if project.key == key:
-                return project
-        return None
+        return self._index.get(key)
 
     # ------------------------------------------------------------------
     # Invokable helpers for QML
@@ -190,6 +250,29 @@ class ProjectListModel(QAbstractListModel):
             return self._project_overview(self._projects[row])
         return {}
 
+    @Slot()
+    def beginBatch(self) -> None:
+        """Defer saving and change notifications for ``setData`` calls.
+
+        Batches nest; the edits are written and announced when the outermost
+        :meth:`endBatch` runs.
+        """
+
+        self._batch_depth += 1
+
+    @Slot()
+    def endBatch(self) -> None:
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth > 0:
+            return
+        dirty = self._save_dirty_rows()
+        if not dirty:
+            return
+        roles = sorted(set().union(*dirty.values()))
+        self.dataChanged.emit(self.index(min(dirty), 0), self.index(max(dirty), 0), roles)
+
     @Slot(str, result="QVariant")
     def getProject(self, key: str) -> Dict[str, Any]:
         if not key:
@@ -1,7 +1,12 @@
 """QML-facing data model and store for LaunchPad projects."""
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+import json
+import math
+from collections import Counter
+from functools import partial
+from importlib import resources
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
 
 from PySide6.QtCore import (
     QAbstractListModel,
@@ -9,12 +14,63 @@ from PySide6.QtCore import (
     QObject,
     Property,
     Qt,
+    QThreadPool,
+    QTimer,
     Signal,
     Slot,
 )
 
 from core.database import ProjectDatabase
 from core.project import Project
+from gui._model_common import (
+    ACTIVE_ROLE,
+    FAVORITE_ROLE,
+    ICON_ROLE,
+    KEY_ROLE,
+    LAST_PROFILE_ROLE,
+    NAME_ROLE,
+    ROLE_NAMES,
+    STATUS_ROLE,
+    TAG_SPLIT,
+    TAGS_ROLE,
+    USAGE_HOURS_ROLE,
+    LoadTask,
+)
+
+_FLUSH_INTERVAL_MS = 100
+_INITIAL_PROJECTS_RESOURCE = "_initial_projects.json"
+_PAGE_SIZE = 30
+
+
+def _initial_project_payloads() -> List[Dict[str, Any]]:
+    """Return the sample projects used to seed an empty database.
+
+    The payloads live in a JSON resource next to this module and are only read
+    when seeding, so they do not stay resident for the life of the process.
+    """
+
+    resource = resources.files(__package__).joinpath(_INITIAL_PROJECTS_RESOURCE)
+    return json.loads(resource.read_text(encoding="utf-8"))
+
+
+def _read_first_page(database: ProjectDatabase) -> Tuple[int, List[Tuple[Project, Dict[str, Any]]]]:
+    """Return the project count and first page, seeding an empty database first."""
+
+    total = database.count_projects()
+    if not total:
+        projects = [Project.from_dict(payload) for payload in _initial_project_payloads()]
+        total = len(database.upsert_projects(projects))
+    return total, database.list_projects_with_details(offset=0, limit=_PAGE_SIZE)
+
+
+def _safe_float(value: Any) -> Optional[float]:
+    """Return *value* as a finite float, or ``None`` when it cannot be converted."""
+
+    try:
+        result = float(value)
+    except (TypeError, ValueError):
+        return None
+    return result if math.isfinite(result) else None
 
 
 def _split_tags(value: Any) -> List[str]:
@@ -23,24 +79,48 @@ def _split_tags(value: Any) -> List[str]:
     if value is None:
         return []
     if isinstance(value, str):
-        return [item.strip() for item in value.split(",") if item.strip()]
+        return [tag for tag in TAG_SPLIT.split(value.strip()) if tag]
     if isinstance(value, Iterable):
-        return [str(item) for item in value if str(item).strip()]
+        return list(filter(None, map(str.strip, map(str, value))))
     return [str(value)]
 
 
 class ProjectListModel(QAbstractListModel):
     """Expose :class:`~core.project.Project` instances to QML."""
 
-    KeyRole = Qt.UserRole + 1
-    NameRole = Qt.UserRole + 2
-    IconRole = Qt.UserRole + 3
-    LastProfileRole = Qt.UserRole + 4
-    TagsRole = Qt.UserRole + 5
-    StatusRole = Qt.UserRole + 6
-    FavoriteRole = Qt.UserRole + 7
-    ActiveRole = Qt.UserRole + 8
-    UsageHoursRole = Qt.UserRole + 9
+    KeyRole = KEY_ROLE
+    NameRole = NAME_ROLE
+    IconRole = ICON_ROLE
+    LastProfileRole = LAST_PROFILE_ROLE
+    TagsRole = TAGS_ROLE
+    StatusRole = STATUS_ROLE
+    FavoriteRole = FAVORITE_ROLE
+    ActiveRole = ACTIVE_ROLE
+    UsageHoursRole = USAGE_HOURS_ROLE
+
+    _OVERVIEW_KEYS = {
+        KeyRole: "key",
+        NameRole: "name",
+        IconRole: "icon",
+        LastProfileRole: "lastProfile",
+        TagsRole: "tags",
+        StatusRole: "status",
+        FavoriteRole: "favorite",
+        ActiveRole: "active",
+        UsageHoursRole: "usageHours",
+    }
+
+    # Editable roles mapped to the Project attribute they write and the
+    # coercion applied to incoming QML values (``None`` rejects the value).
+    _SETTERS: Dict[int, Tuple[str, Callable[[Any], Any]]] = {
+        FavoriteRole: ("favorite", bool),
+        ActiveRole: ("active", bool),
+        LastProfileRole: ("last_profile", str),
+        StatusRole: ("status", str),
+        UsageHoursRole: ("usage_hours", _safe_float),
+    }
+    # ``dataChanged`` role arguments, built once instead of per edit.
+    _ROLE_SINGLETON_LISTS: Dict[int, List[int]] = {role: [role] for role in _SETTERS}
 
     countChanged = Signal()
 
@@ -48,19 +128,11 @@ class ProjectListModel(QAbstractListModel):
         super().__init__(parent)
         self._store = store
         self._projects: List[Project] = []
-        self._overview: List[Dict[str, Any]] = []
+        # Column-oriented overview storage: one list per role, indexed by row.
+        self._columns: Dict[int, List[Any]] = {role: [] for role in self._OVERVIEW_KEYS}
         self._key_to_row: Dict[str, int] = {}
-        self._role_names = {
-            int(self.KeyRole): b"key",
-            int(self.NameRole): b"name",
-            int(self.IconRole): b"icon",
-            int(self.LastProfileRole): b"lastProfile",
-            int(self.TagsRole): b"tags",
-            int(self.StatusRole): b"status",
-            int(self.FavoriteRole): b"favorite",
-            int(self.ActiveRole): b"active",
-            int(self.UsageHoursRole): b"usageHours",
-        }
+        self._fetched = 0
+        self._total = 0
 
     # ------------------------------------------------------------------
     # Qt model API
@@ -70,37 +142,31 @@ class ProjectListModel(QAbstractListModel):
             return 0
         return len(self._projects)
 
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:  # type: ignore[override]
+        if parent.isValid():
+            return False
+        return self._fetched < self._total
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:  # type: ignore[override]
+        if parent.isValid() or self._fetched >= self._total:
+            return
+        self.append_page(self._store.load_page(self._fetched, _PAGE_SIZE))
+
     def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:  # type: ignore[override]
         if not index.isValid():
             return None
         row = index.row()
         if row < 0 or row >= len(self._projects):
             return None
-        overview = self._overview[row]
         if role == Qt.DisplayRole:
-            return overview.get("name")
-        if role == int(self.KeyRole):
-            return overview.get("key")
-        if role == int(self.NameRole):
-            return overview.get("name")
-        if role == int(self.IconRole):
-            return overview.get("icon")
-        if role == int(self.LastProfileRole):
-            return overview.get("lastProfile")
-        if role == int(self.TagsRole):
-            return overview.get("tags")
-        if role == int(self.StatusRole):
-            return overview.get("status")
-        if role == int(self.FavoriteRole):
-            return overview.get("favorite")
-        if role == int(self.ActiveRole):
-            return overview.get("active")
-        if role == int(self.UsageHoursRole):
-            return overview.get("usageHours")
-        return None
+            role = NAME_ROLE
+        column = self._columns.get(role)
+        if column is None:
+            return None
+        return column[row]
 
     def roleNames(self) -> Dict[int, bytes]:  # type: ignore[override]
-        return self._role_names
+        return ROLE_NAMES
 
     def flags(self, index: QModelIndex) -> Qt.ItemFlags:  # type: ignore[override]
         if not index.isValid():
@@ -113,46 +179,17 @@ class ProjectListModel(QAbstractListModel):
         row = index.row()
         if row < 0 or row >= len(self._projects):
             return False
+        setter = self._SETTERS.get(role)
+        if setter is None:
+            return False
+        attribute, coerce = setter
+        new_value = coerce(value)
         project = self._projects[row]
-        changed_roles: List[int] = []
-
-        if role == int(self.FavoriteRole):
-            new_value = bool(value)
-            if project.favorite == new_value:
-                return False
-            project.favorite = new_value
-            changed_roles.append(role)
-        elif role == int(self.ActiveRole):
-            new_value = bool(value)
-            if project.active == new_value:
-                return False
-            project.active = new_value
-            changed_roles.append(role)
-        elif role == int(self.LastProfileRole):
-            new_value = str(value)
-            if project.last_profile == new_value:
-                return False
-            project.last_profile = new_value
-            changed_roles.append(role)
-        elif role == int(self.StatusRole):
-            new_value = str(value)
-            if project.status == new_value:
-                return False
-            project.status = new_value
-            changed_roles.append(role)
-        elif role == int(self.UsageHoursRole):
-            try:
-                new_value = float(value)
-            except (TypeError, ValueError):
-                return False
-            if project.usage_hours == new_value:
-                return False
-            project.usage_hours = new_value
-            changed_roles.append(role)
-        else:
+        if new_value is None or getattr(project, attribute) == new_value:
             return False
-
-        self._overview[row] = project.to_overview()
+        setattr(project, attribute, new_value)
+        self._columns[role][row] = new_value
+        changed_roles = self._ROLE_SINGLETON_LISTS[role]
         model_index = self.index(row, 0)
         self.dataChanged.emit(model_index, model_index, changed_roles)
         self._store.on_project_updated(project, changed_roles)
@@ -165,39 +202,84 @@ class ProjectListModel(QAbstractListModel):
     # ------------------------------------------------------------------
     # Model maintenance helpers
     # ------------------------------------------------------------------
-    def replace(self, projects: Iterable[Project]) -> None:
-        self.beginResetModel()
-        self._projects = list(projects)
-        self._overview = [project.to_overview() for project in self._projects]
-        self._key_to_row = {project.key: row for row, project in enumerate(self._projects)}
-        self.endResetModel()
-        self.countChanged.emit()
+    def add_or_update(self, project: Project, overview: Optional[Dict[str, Any]] = None) -> bool:
+        """Append *project* or refresh its row; returns ``True`` for new rows.
+
+        *overview* may be passed when the caller already built it.
+        """
 
-    def add_or_update(self, project: Project) -> bool:
+        if overview is None:
+            overview = project.to_overview()
         row = self._key_to_row.get(project.key)
         if row is None:
             row = len(self._projects)
             self.beginInsertRows(QModelIndex(), row, row)
             self._projects.append(project)
-            self._overview.append(project.to_overview())
+            self._append_overview(overview)
             self._key_to_row[project.key] = row
+            self._total += 1
             self.endInsertRows()
             self.countChanged.emit()
             return True
-        self._projects[row] = project
-        self._overview[row] = project.to_overview()
-        model_index = self.index(row, 0)
-        self.dataChanged.emit(model_index, model_index, list(self._role_names.keys()))
+        self._update_row(row, project, overview)
         return False
 
-    def iter_projects(self) -> Iterable[Project]:
-        return tuple(self._projects)
+    def _append_overview(self, overview: Dict[str, Any]) -> None:
+        for role, key in self._OVERVIEW_KEYS.items():
+            self._columns[role].append(overview[key])
+
+    def _update_row(self, row: int, project: Project, overview: Dict[str, Any]) -> None:
+        """Store *project* at *row* and notify views of the roles that changed."""
+
+        self._projects[row] = project
+        changed_roles: List[int] = []
+        for role, key in self._OVERVIEW_KEYS.items():
+            column = self._columns[role]
+            value = overview[key]
+            if column[row] != value:
+                column[row] = value
+                changed_roles.append(role)
+        if changed_roles:
+            model_index = self.index(row, 0)
+            self.dataChanged.emit(model_index, model_index, changed_roles)
+
+    def reset_paged(self, total: int) -> None:
+        """Clear the model and expect *total* rows to arrive via :meth:`fetchMore`."""
+
+        self.beginResetModel()
+        self._projects = []
+        self._columns = {role: [] for role in self._OVERVIEW_KEYS}
+        self._key_to_row = {}
+        self._fetched = 0
+        self._total = total
+        self.endResetModel()
+        self.countChanged.emit()
+
+    def append_page(self, page: Sequence[Tuple[Project, Dict[str, Any]]]) -> None:
+        """Append a page of ``(project, payload)`` pairs read from the database."""
+
+        self._fetched += len(page)
+        if len(page) < _PAGE_SIZE:
+            self._total = self._fetched
+        # Rows added through add_or_update may already be present.
+        fresh = [pair for pair in page if pair[0].key not in self._key_to_row]
+        if not fresh:
+            return
+        first = len(self._projects)
+        self.beginInsertRows(QModelIndex(), first, first + len(fresh) - 1)
+        for row, (project, _) in enumerate(fresh, start=first):
+            self._projects.append(project)
+            self._append_overview(project.to_overview())
+            self._key_to_row[project.key] = row
+        self.endInsertRows()
+        self.countChanged.emit()
+        self._store.on_projects_loaded(fresh)
 
     @Slot(int, result="QVariant")
     def get(self, row: int) -> Dict[str, Any]:
-        if row < 0 or row >= len(self._overview):
+        if row < 0 or row >= len(self._projects):
             return {}
-        return dict(self._overview[row])
+        return {key: self._columns[role][row] for role, key in self._OVERVIEW_KEYS.items()}
 
 
 class ProjectStore(QObject):
@@ -206,6 +288,7 @@ class ProjectStore(QObject):
     projectsModelChanged = Signal()
     projectDetailsChanged = Signal()
     tagOptionsChanged = Signal()
+    loadedChanged = Signal()
 
     def __init__(self, database: Optional[ProjectDatabase] = None, parent: Optional[QObject] = None) -> None:
         super().__init__(parent)
@@ -213,6 +296,16 @@ class ProjectStore(QObject):
         self._model = ProjectListModel(self)
         self._project_details: Dict[str, Dict[str, Any]] = {}
         self._tag_options: List[str] = []
+        self._tag_counts: Counter[str] = Counter()
+        self._project_tags: Dict[str, FrozenSet[str]] = {}
+        self._pending: Dict[str, Project] = {}
+        self._pending_tags = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+        self._loaded = False
+        self._load_task: Optional[LoadTask] = None
         self._load_initial_projects()
 
     # ------------------------------------------------------------------
@@ -230,56 +323,132 @@ class ProjectStore(QObject):
     def tagOptions(self) -> List[str]:
         return self._tag_options
 
+    @Property(bool, notify=loadedChanged)
+    def loaded(self) -> bool:
+        return self._loaded
+
     # ------------------------------------------------------------------
     # QML API
     # ------------------------------------------------------------------
     @Slot("QVariantMap", result=bool)
     def create_from_summary(self, summary: Dict[str, Any]) -> bool:
+        if not self._loaded:
+            return False
         try:
             project = self._project_from_summary(summary)
         except ValueError:
             return False
+        self._pending.pop(project.key, None)
         project = self._database.upsert_project(project)
-        self._model.add_or_update(project)
-        self._project_details[project.key] = project.to_dict()
+        overview, details = project.to_payload()
+        self._model.add_or_update(project, overview)
+        self._project_details[project.key] = details
         self.projectDetailsChanged.emit()
-        self._update_tag_options()
+        self._apply_tag_delta([project])
         return True
 
     @Slot(str, result="QVariantMap")
     def get_project(self, key: str) -> Dict[str, Any]:
-        return self._project_details.get(key, {})
+        details = self._project_details.get(key)
+        if details is None:
+            project = self._database.get_project(key) if key else None
+            if project is None:
+                return {}
+            details = self._project_details[key] = project.to_dict()
+        return details
+
+    @Slot()
+    def flush(self) -> None:
+        """Persist edits queued by :meth:`on_project_updated`."""
+
+        self._flush_timer.stop()
+        if not self._pending:
+            return
+        projects = list(self._pending.values())
+        self._pending.clear()
+        self._database.upsert_projects(projects)
+        for project in projects:
+            self._project_details[project.key] = project.to_dict()
+        self.projectDetailsChanged.emit()
+        if self._pending_tags:
+            self._pending_tags = False
+            self._apply_tag_delta(projects)
 
     # ------------------------------------------------------------------
     # Callbacks from the list model
     # ------------------------------------------------------------------
-    def on_project_updated(self, project: Project, roles: Sequence[int]) -> None:
-        self._database.upsert_project(project)
-        self._project_details[project.key] = project.to_dict()
+    def load_page(self, offset: int, limit: int) -> List[Tuple[Project, Dict[str, Any]]]:
+        return self._database.list_projects_with_details(offset=offset, limit=limit)
+
+    def on_projects_loaded(self, page: Sequence[Tuple[Project, Dict[str, Any]]]) -> None:
+        """Keep the decoded payloads of newly added rows as their details."""
+
+        for project, payload in page:
+            self._project_details[project.key] = payload
         self.projectDetailsChanged.emit()
-        if int(ProjectListModel.TagsRole) in roles:
-            self._update_tag_options()
+        self._apply_tag_delta(project for project, _ in page)
+
+    def on_project_updated(self, project: Project, roles: Sequence[int]) -> None:
+        """Queue *project* to be saved; rapid edits are written in one batch."""
+
+        self._pending[project.key] = project
+        if TAGS_ROLE in roles:
+            self._pending_tags = True
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
     def _load_initial_projects(self) -> None:
-        projects = self._database.list_projects()
-        if not projects:
-            projects = [Project.from_dict(payload) for payload in _INITIAL_PROJECTS]
-            for project in projects:
-                self._database.upsert_project(project)
-        self._model.replace(projects)
-        self._project_details = {project.key: project.to_dict() for project in self._model.iter_projects()}
-        self.projectDetailsChanged.emit()
-        self._update_tag_options()
-
-    def _update_tag_options(self) -> None:
-        tags = set()
-        for project in self._model.iter_projects():
-            tags.update(project.tags)
-        self._tag_options = sorted(tags)
-        self.tagOptionsChanged.emit()
+        """Read the first page of projects on a worker thread."""
+
+        # Always report back (an empty load on failure): the store only becomes
+        # ``loaded``, and accepts new projects, once a result arrives.
+        self._load_task = LoadTask(partial(_read_first_page, self._database), (0, []))
+        self._load_task.signals.finished.connect(self._on_initial_load_finished)
+        QThreadPool.globalInstance().start(self._load_task)
+
+    @Slot(object)
+    def _on_initial_load_finished(self, result: Any) -> None:
+        total, page = result
+        self._load_task = None
+        self._model.reset_paged(total)
+        self._model.append_page(page)
+        self._loaded = True
+        self.loadedChanged.emit()
+        if self._model.canFetchMore(QModelIndex()):
+            QTimer.singleShot(0, self, self._fetch_remaining)
+
+    def _fetch_remaining(self) -> None:
+        # Views built from Repeaters never call fetchMore themselves, so keep
+        # paging in idle event-loop turns until every row has been loaded.
+        self._model.fetchMore(QModelIndex())
+        if self._model.canFetchMore(QModelIndex()):
+            QTimer.singleShot(0, self, self._fetch_remaining)
+
+    def _apply_tag_delta(self, projects: Iterable[Project]) -> None:
+        """Update the tag multiset for *projects* and re-sort only if the tag set changed."""
+
+        keyset_changed = False
+        for project in projects:
+            old_tags = self._project_tags.get(project.key, frozenset())
+            new_tags = frozenset(project.tags)
+            if old_tags == new_tags:
+                continue
+            self._project_tags[project.key] = new_tags
+            for tag in old_tags - new_tags:
+                self._tag_counts[tag] -= 1
+                if self._tag_counts[tag] <= 0:
+                    del self._tag_counts[tag]
+                    keyset_changed = True
+            for tag in new_tags - old_tags:
+                if tag not in self._tag_counts:
+                    keyset_changed = True
+                self._tag_counts[tag] += 1
+        if keyset_changed:
+            self._tag_options = sorted(self._tag_counts)
+            self.tagOptionsChanged.emit()
 
     def _project_from_summary(self, summary: Dict[str, Any]) -> Project:
         key = str(summary.get("key", "")).strip()
@@ -322,231 +491,4 @@ class ProjectStore(QObject):
         return Project.from_dict(payload)
 
 
-_INITIAL_PROJECTS: List[Dict[str, Any]] = [
-    {
-        "key": "nebula",
-        "name": "Nebula CRM",
-        "icon": "🪐",
-        "defaultProfile": "dev",
-        "lastProfile": "dev",
-        "summary": "Customer portal with FastAPI backend and Vue dashboard.",
-        "tags": ["fastapi", "postgres", "docker"],
-        "status": "Ready",
-        "favorite": True,
-        "active": True,
-        "usageHours": 18.5,
-        "components": [
-            {
-                "name": "FastAPI Service",
-                "status": "Running",
-                "summary": "Uvicorn server with auto-reload",
-                "statusDetail": "HTTP 200 · Port 8000",
-                "logs": [
-                    "[09:40] Boot sequence started",
-                    "[09:40] Loaded environment dev",
-                    "[09:41] Listening on 0.0.0.0:8000",
-                ],
-                "healthChecks": [
-                    {"label": "HTTP", "status": "Healthy", "detail": "200 OK"},
-                    {"label": "Docker", "status": "Healthy", "detail": "Container healthy"},
-                ],
-            },
-            {
-                "name": "Worker Queue",
-                "status": "Running",
-                "summary": "Celery worker connected to Redis",
-                "statusDetail": "Processing 3 jobs",
-                "logs": [
-                    "[09:39] Worker online",
-                    "[09:41] Consumed task send_welcome_email",
-                ],
-                "healthChecks": [
-                    {"label": "Redis", "status": "Healthy", "detail": "Ping 1.2ms"},
-                ],
-            },
-            {
-                "name": "Frontend Dev Server",
-                "status": "Paused",
-                "summary": "Vite dev server for Vue dashboard",
-                "statusDetail": "Paused by user",
-                "logs": [
-                    "[08:12] npm run dev",
-                    "[08:15] Hot reload triggered",
-                ],
-                "healthChecks": [
-                    {"label": "HTTP", "status": "Paused", "detail": "Server paused"},
-                ],
-            },
-        ],
-        "quickLinks": [
-            {"label": "Swagger Docs", "url": "http://localhost:8000/docs"},
-            {"label": "Admin Portal", "url": "http://localhost:5173"},
-        ],
-        "folders": [
-            {"label": "Repository", "path": "~/Projects/nebula"},
-            {"label": "Docker Compose", "path": "~/Projects/nebula/ops"},
-        ],
-        "history": [
-            {"time": "09:42", "description": "Launch (dev)"},
-            {"time": "09:44", "description": "Restart FastAPI"},
-            {"time": "09:50", "description": "Teardown frontend"},
-        ],
-        "healthChecks": [
-            {"label": "API endpoint", "status": "Healthy", "detail": "200 OK"},
-            {"label": "Docker compose", "status": "Healthy", "detail": "All containers healthy"},
-            {"label": "Port 8000", "status": "Healthy", "detail": "Listening"},
-        ],
-    },
-    {
-        "key": "aurora",
-        "name": "Aurora Analytics",
-        "icon": "📊",
-        "defaultProfile": "staging",
-        "lastProfile": "staging",
-        "summary": "Data pipeline with Node + Vite front-end dashboard.",
-        "tags": ["data", "frontend", "vite"],
-        "status": "Running",
-        "favorite": False,
-        "active": True,
-        "usageHours": 9.2,
-        "components": [
-            {
-                "name": "Ingestion Worker",
-                "status": "Running",
-                "summary": "Python ETL job",
-                "statusDetail": "Processing feed alpha",
-                "logs": [
-                    "[08:30] Sync started",
-                    "[08:45] 1234 records processed",
-                ],
-                "healthChecks": [
-                    {"label": "Database", "status": "Healthy", "detail": "Latency 20ms"},
-                ],
-            },
-            {
-                "name": "Analytics UI",
-                "status": "Running",
-                "summary": "Vite dev server",
-                "statusDetail": "Listening on 5174",
-                "logs": [
-                    "[08:12] yarn dev",
-                    "[08:20] Hot reload",
-                ],
-                "healthChecks": [
-                    {"label": "HTTP", "status": "Healthy", "detail": "200 OK"},
-                ],
-            },
-        ],
-        "quickLinks": [
-            {"label": "Vite Dashboard", "url": "http://localhost:5174"},
-            {"label": "Grafana", "url": "http://localhost:3000"},
-        ],
-        "folders": [
-            {"label": "Repository", "path": "~/Projects/aurora"},
-        ],
-        "history": [
-            {"time": "Yesterday", "description": "Deploy staging"},
-        ],
-        "healthChecks": [
-            {"label": "HTTP 5174", "status": "Healthy", "detail": "Dashboard ready"},
-            {"label": "Queue depth", "status": "Healthy", "detail": "4 pending"},
-        ],
-    },
-    {
-        "key": "lunar",
-        "name": "Lunar Ops",
-        "icon": "🌗",
-        "defaultProfile": "dev",
-        "lastProfile": "dev",
-        "summary": "Dockerized ops toolkit with mixed services.",
-        "tags": ["docker", "compose", "ops"],
-        "status": "Needs Attention",
-        "favorite": False,
-        "active": False,
-        "usageHours": 3.4,
-        "components": [
-            {
-                "name": "API Gateway",
-                "status": "Failed",
-                "summary": "Nginx reverse proxy",
-                "statusDetail": "Container exited",
-                "logs": [
-                    "[07:12] nginx start",
-                    "[07:15] missing certificate",
-                ],
-                "healthChecks": [
-                    {"label": "Docker", "status": "Failed", "detail": "Exited (1)"},
-                ],
-            },
-            {
-                "name": "Telemetry",
-                "status": "Stopped",
-                "summary": "Prometheus instance",
-                "statusDetail": "Stopped by user",
-                "logs": [
-                    "[06:50] Shutdown initiated",
-                ],
-                "healthChecks": [
-                    {"label": "Port 9090", "status": "Stopped", "detail": "Not listening"},
-                ],
-            },
-        ],
-        "quickLinks": [
-            {"label": "Operations Wiki", "url": "http://confluence.local/lunar"},
-        ],
-        "folders": [
-            {"label": "Repository", "path": "~/Projects/lunar"},
-            {"label": "Docker", "path": "~/Projects/lunar/docker"},
-        ],
-        "history": [
-            {"time": "Today", "description": "Launch attempt failed"},
-        ],
-        "healthChecks": [
-            {"label": "Gateway", "status": "Failed", "detail": "Container exited"},
-            {"label": "Prometheus", "status": "Stopped", "detail": "Inactive"},
-        ],
-    },
-    {
-        "key": "quasar",
-        "name": "Quasar Docs",
-        "icon": "📚",
-        "defaultProfile": "dev",
-        "lastProfile": "dev",
-        "summary": "Documentation toolchain built with mdBook.",
-        "tags": ["docs", "mdbook"],
-        "status": "Ready",
-        "favorite": True,
-        "active": False,
-        "usageHours": 6.8,
-        "components": [
-            {
-                "name": "mdBook Serve",
-                "status": "Running",
-                "summary": "mdbook serve --open",
-                "statusDetail": "Listening on :3001",
-                "logs": [
-                    "[08:01] Rebuild complete",
-                    "[08:05] Watching files",
-                ],
-                "healthChecks": [
-                    {"label": "HTTP", "status": "Healthy", "detail": "200 OK"},
-                ],
-            },
-        ],
-        "quickLinks": [
-            {"label": "Docs", "url": "http://localhost:3001"},
-            {"label": "GitHub", "url": "https://github.com/org/quasar"},
-        ],
-        "folders": [
-            {"label": "Repository", "path": "~/Projects/quasar"},
-        ],
-        "history": [
-            {"time": "Today", "description": "Launch (dev)"},
-        ],
-        "healthChecks": [
-            {"label": "HTTP", "status": "Healthy", "detail": "200 OK"},
-        ],
-    },
-]
-
 __all__ = ["ProjectStore", "ProjectListModel"]
@@ -49,10 +49,10 @@ Item {
         return project.status === statusFilter
     }
 
-    function includeProject(index) {
-        if (!projectsModel || index < 0 || index >= projectsModel.count)
+    // Accepts a delegate's model object or a row from projectsModel.get().
+    function includeProject(project) {
+        if (!project)
             return false
-        var project = projectsModel.get(index)
         if (favoritesOnly && !project.favorite)
             return false
         if (!matchesSearch(project))
@@ -74,7 +74,7 @@ Item {
                 continue
             if (favoritesFlag === false && project.favorite)
                 continue
-            if (includeProject(i))
+            if (includeProject(project))
                 total += 1
         }
         return total
@@ -254,7 +254,7 @@ Item {
                                     Repeater {
                                         model: projectsModel
                                         delegate: ProjectCard {
-                                            visible: includeProject(index) && model.favorite
+                                            visible: includeProject(model) && model.favorite
                                             key: model.key
                                             iconGlyph: model.icon
                                             projectName: model.name
@@ -293,7 +293,7 @@ Item {
                                     Repeater {
                                         model: projectsModel
                                         delegate: ProjectCard {
-                                            visible: includeProject(index) && !model.favorite
+                                            visible: includeProject(model) && !model.favorite
                                             key: model.key
                                             iconGlyph: model.icon
                                             projectName: model.name
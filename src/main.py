@@ -23,7 +23,6 @@ if __name__ == "__main__":
     context.setContextProperty("projectLauncher", launch_service)
     engine.rootContext().setContextProperty("projectModel", model)
 
-    database = ProjectDatabase()
     project_store = ProjectStore(database=database)
     engine.rootContext().setContextProperty("projectStore", project_store)
 
@@ -38,7 +37,8 @@ if __name__ == "__main__":
         print("Error: Could not load QML file.")
         sys.exit(-1)
 
-    # Close the database connection when the app exits
+    # Write any queued edits, then close the database connection when the app exits
+    app.aboutToQuit.connect(project_store.flush)
     app.aboutToQuit.connect(database.close)
 
     # Execute the application's event loop
@@ -0,0 +1,207 @@
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.core.database import ProjectDatabase
+from src.core.project import Component, Project
+
+
+class TestProjectDatabase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.database = ProjectDatabase(Path(self._tmpdir.name) / "projects.db")
+
+    def tearDown(self):
+        self.database.close()
+        self._tmpdir.cleanup()
+
+    def test_connection_uses_wal_journal(self):
+        conn = self.database.connect()
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_upsert_and_get_round_trip(self):
+        project = Project(key="demo", name="Demo", tags=["web", "api"])
+        self.database.upsert_project(project)
+
+        loaded = self.database.get_project("demo")
+
+        self.assertIsNotNone(loaded)
+        self.assertEqual(loaded.name, "Demo")
+        self.assertEqual(loaded.tags, ("web", "api"))
+        self.assertIsNotNone(loaded.created_at)
+
+    def test_usage_hours_round_trip_rejects_non_finite_values(self):
+        self.database.upsert_project(Project(key="demo", name="Demo", usage_hours=2.5))
+
+        with self.assertRaises(ValueError):
+            self.database.upsert_project(Project(key="demo", name="Demo", usage_hours=float("inf")))
+
+        self.assertEqual(self.database.get_project("demo").usage_hours, 2.5)
+        self.assertEqual([project.usage_hours for project in self.database.list_projects()], [2.5])
+
+    def test_null_usage_hours_loads_as_zero(self):
+        self.database.upsert_project(Project(key="demo", name="Demo", usage_hours=2.5))
+        with self.database.transaction() as txn:
+            txn.execute("UPDATE projects SET data = json_set(data, '$.usageHours', json('null'))")
+
+        self.assertEqual([project.usage_hours for project in self.database.list_projects()], [0.0])
+        project, _ = self.database.list_projects_with_details()[0]
+        self.assertEqual(project.usage_hours, 0.0)
+
+    def test_reads_see_committed_writes(self):
+        self.database.upsert_project(Project(key="alpha", name="Alpha"))
+        self.database.upsert_project(Project(key="beta", name="Beta"))
+
+        with self.database.read() as conn:
+            with self.assertRaises(sqlite3.OperationalError):
+                conn.execute("DELETE FROM projects")
+
+        keys = [project.key for project in self.database.list_projects()]
+        self.assertEqual(keys, ["alpha", "beta"])
+
+    def test_close_while_reading_does_not_recycle_closed_connection(self):
+        self.database.upsert_project(Project(key="alpha", name="Alpha"))
+
+        with self.database.read() as conn:
+            self.database.close()
+            conn.execute("SELECT COUNT(*) FROM projects").fetchone()
+
+        self.assertEqual([project.key for project in self.database.list_projects()], ["alpha"])
+
+    def test_failed_commit_is_rolled_back(self):
+        conn = self.database.connect()
+        conn.execute("CREATE TEMP TABLE parent (id INTEGER PRIMARY KEY)")
+        conn.execute(
+            "CREATE TEMP TABLE child (parent_id INTEGER REFERENCES parent(id) DEFERRABLE INITIALLY DEFERRED)"
+        )
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            with self.database.transaction() as txn:
+                txn.execute("INSERT INTO child VALUES (1)")
+
+        self.assertFalse(conn.in_transaction)
+        self.database.upsert_project(Project(key="demo", name="Demo"))
+        self.assertIsNotNone(self.database.get_project("demo"))
+
+    def test_transactions_take_the_write_lock_up_front(self):
+        self.database.upsert_project(Project(key="demo", name="Demo"))
+        other = sqlite3.connect(Path(self._tmpdir.name) / "projects.db", timeout=0, isolation_level=None)
+        try:
+            with self.database.transaction():
+                with self.assertRaises(sqlite3.OperationalError):
+                    other.execute("BEGIN IMMEDIATE")
+        finally:
+            other.close()
+
+    def test_in_memory_database_reads_from_writer(self):
+        database = ProjectDatabase(":memory:")
+        database.upsert_project(Project(key="mem", name="Memory"))
+        self.assertEqual(database.get_project("mem").name, "Memory")
+        database.close()
+
+    def test_bulk_import_preserves_created_at(self):
+        original = self.database.upsert_project(Project(key="alpha", name="Alpha"))
+
+        self.database.bulk_import([
+            Project(key="alpha", name="Alpha Renamed"),
+            Project(key="beta", name="Beta"),
+        ])
+
+        alpha = self.database.get_project("alpha")
+        self.assertEqual(alpha.name, "Alpha Renamed")
+        self.assertEqual(alpha.created_at, original.created_at)
+        self.assertIsNotNone(self.database.get_project("beta"))
+
+    def test_upsert_projects_returns_stored_created_at(self):
+        original = self.database.upsert_project(Project(key="alpha", name="Alpha"))
+
+        saved = self.database.upsert_projects([Project(key="alpha", name="Alpha Renamed")])
+
+        self.assertEqual(saved[0].created_at, original.created_at)
+
+    def test_in_place_updates_return_updated_project(self):
+        self.database.upsert_project(Project(key="alpha", name="Alpha"))
+
+        favorite = self.database.set_favorite("alpha", True)
+        profiled = self.database.update_last_profile("alpha", "prod")
+        logged = self.database.record_history("alpha", "Launch (prod)", "10:00")
+
+        self.assertTrue(favorite.favorite)
+        self.assertEqual(profiled.last_profile, "prod")
+        self.assertEqual(logged.history[-1].description, "Launch (prod)")
+        stored = self.database.get_project("alpha")
+        self.assertTrue(stored.favorite)
+        self.assertEqual(stored.last_profile, "prod")
+        self.assertEqual(len(stored.history), 1)
+        self.assertIsNone(self.database.set_favorite("missing", True))
+
+    def test_get_project_reuses_unchanged_rows(self):
+        self.database.upsert_project(Project(key="alpha", name="Alpha"))
+
+        first = self.database.get_project("alpha")
+        with mock.patch.object(ProjectDatabase, "_row_to_project") as decode:
+            second = self.database.get_project("alpha")
+        decode.assert_not_called()
+        self.assertEqual(second, first)
+        self.assertIsNot(second, first)
+
+        self.database.set_favorite("alpha", True)
+        refreshed = self.database.get_project("alpha")
+        self.assertIsNot(refreshed, first)
+        self.assertTrue(refreshed.favorite)
+
+        self.database.delete_project("alpha")
+        self.assertIsNone(self.database.get_project("alpha"))
+
+    def test_list_projects_reuses_unchanged_rows(self):
+        self.database.upsert_projects([Project(key="a", name="A"), Project(key="b", name="B")])
+
+        first = self.database.list_projects()
+        self.database.set_favorite("b", True)
+        with mock.patch.object(ProjectDatabase, "_row_to_project", wraps=ProjectDatabase._row_to_project) as decode:
+            second = self.database.list_projects()
+
+        self.assertEqual(decode.call_count, 1)
+        self.assertEqual(second[0], first[0])
+        self.assertFalse(first[1].favorite)
+        self.assertTrue(second[1].favorite)
+
+    def test_edits_to_returned_projects_do_not_leak_into_the_cache(self):
+        self.database.upsert_project(Project(key="a", name="A"))
+
+        self.database.list_projects()[0].name = "Edited"
+        self.database.get_project("a").components.append(Component(name="api", status="Running"))
+
+        self.assertEqual(self.database.get_project("a").name, "A")
+        self.assertEqual(self.database.list_projects()[0].components, [])
+
+    def test_upsert_projects_returns_saved_projects(self):
+        saved = self.database.upsert_projects([Project(key="a", name="A"), Project(key="b", name="B")])
+
+        self.assertEqual([project.key for project in saved], ["a", "b"])
+        self.assertTrue(all(project.updated_at is not None for project in saved))
+        self.assertEqual(len(self.database.list_projects()), 2)
+
+    def test_list_projects_pages_by_name(self):
+        self.database.upsert_projects(Project(key=key, name=key.title()) for key in ("c", "a", "d", "b"))
+
+        self.assertEqual(self.database.count_projects(), 4)
+        first = self.database.list_projects(offset=0, limit=3)
+        rest = self.database.list_projects(offset=3, limit=3)
+        self.assertEqual([project.key for project in first], ["a", "b", "c"])
+        self.assertEqual([project.key for project in rest], ["d"])
+
+    def test_list_projects_with_details_matches_to_dict(self):
+        self.database.upsert_project(Project(key="alpha", name="Alpha", tags=["web"]))
+
+        [(project, details)] = self.database.list_projects_with_details()
+
+        self.assertEqual(details, project.to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import itertools
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from src.core import launcher
+from src.core.launcher import LaunchService
+from src.core.project import Component, Project
+
+
+def _reference_status(statuses):
+    """The any()/all() precedence ``_derive_project_status`` must preserve."""
+
+    statuses = [status.lower() for status in statuses]
+    if not statuses:
+        return "Ready"
+    if any("fail" in status or "error" in status for status in statuses):
+        return "Needs Attention"
+    if any("running" in status for status in statuses):
+        return "Running"
+    if any("paused" in status for status in statuses):
+        return "Paused"
+    if all("stopped" in status for status in statuses):
+        return "Stopped"
+    return "Ready"
+
+
+class TestLaunchService(unittest.TestCase):
+
+    def setUp(self):
+        self.service = LaunchService()
+
+    def test_projects_are_listed_by_name(self):
+        names = [overview["name"] for overview in self.service.project_overview()]
+
+        self.assertEqual(names, sorted(names, key=str.casefold))
+        self.assertEqual(list(self.service.project_details()), [
+            "aurora", "lunar", "nebula", "quasar",
+        ])
+
+    def test_launch_refreshes_cached_payloads(self):
+        self.service.project_overview_for("lunar")
+        self.service.project_detail("lunar")
+
+        result = self.service.launch_project("lunar", "prod")
+
+        self.assertEqual(result["overview"]["status"], "Running")
+        self.assertEqual(result["overview"]["lastProfile"], "prod")
+        self.assertEqual(self.service.project_overview_for("lunar"), result["overview"])
+        detail = self.service.project_detail("lunar")
+        self.assertEqual(detail, result["project"])
+        self.assertEqual({component["status"] for component in detail["components"]}, {"Running"})
+        self.assertEqual(detail["history"][-1]["description"], "Launch (prod)")
+
+    def test_stop_component_refreshes_cached_payloads(self):
+        before = self.service.project_detail("quasar")
+        self.assertEqual(self.service.project_overview_for("quasar")["status"], "Running")
+
+        result = self.service.stop_component("quasar", "mdBook Serve")
+
+        self.assertEqual(result["overview"]["status"], "Stopped")
+        self.assertFalse(result["overview"]["active"])
+        detail = self.service.project_detail("quasar")
+        self.assertIsNot(detail, before)
+        self.assertEqual(detail["components"][0]["status"], "Stopped")
+        self.assertEqual(detail["components"][0]["statusDetail"], "Stopped via LaunchPad")
+        self.assertEqual(self.service.project_overview()[3]["status"], "Stopped")
+
+    def test_unknown_targets_return_empty_payloads(self):
+        self.assertEqual(self.service.project_detail("missing"), {})
+        self.assertEqual(self.service.launch_project("missing", ""), {})
+        self.assertEqual(self.service.stop_component("quasar", "missing"), {})
+
+    def test_derived_status_matches_precedence_rules(self):
+        vocabulary = ["Running", "Paused", "Stopped", "Failed", "Error", "Starting", "", "Stopped (error)"]
+        for size in range(4):
+            for statuses in itertools.product(vocabulary, repeat=size):
+                project = Project(
+                    key="demo",
+                    name="Demo",
+                    components=[Component(name=str(index), status=status) for index, status in enumerate(statuses)],
+                )
+                with self.subTest(statuses=statuses):
+                    self.assertEqual(self.service._derive_project_status(project), _reference_status(statuses))
+
+
+class TestTimestamp(unittest.TestCase):
+
+    def setUp(self):
+        launcher._timestamp_cache = (-1, "")
+
+    def tearDown(self):
+        launcher._timestamp_cache = (-1, "")
+
+    def _timestamp_at(self, seconds):
+        with mock.patch.object(launcher.time, "time", return_value=seconds):
+            return launcher._timestamp()
+
+    def test_timestamp_follows_the_minute(self):
+        start = 1_700_000_040.0
+        expected = datetime.fromtimestamp(start).strftime("%H:%M")
+
+        self.assertEqual(self._timestamp_at(start), expected)
+        self.assertEqual(self._timestamp_at(start + 59.9), expected)
+        self.assertEqual(self._timestamp_at(start + 60), datetime.fromtimestamp(start + 60).strftime("%H:%M"))
+        self.assertEqual(self._timestamp_at(start), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from src.core.project import Project
+from datetime import datetime
+from src.core.project import Component, Project
 
 class TestProject(unittest.TestCase):
 
@@ -26,5 +27,112 @@ class TestProject(unittest.TestCase):
             "Tags should be correctly preserved in the overview",
         )
 
+    def test_component_logs_keep_most_recent_entries(self):
+        component = Component(name="api", status="Running", logs=[str(i) for i in range(150)])
+
+        component.logs.append("latest")
+
+        self.assertEqual(len(component.logs), 100)
+        self.assertEqual(component.logs[-1], "latest")
+        self.assertEqual(component.to_dict()["logs"][0], "51")
+        self.assertIsInstance(component.to_dict()["logs"], list)
+
+    def test_component_from_dict_keeps_most_recent_logs(self):
+        component = Component.from_dict({"name": "api", "status": "Running", "logs": range(150)})
+
+        self.assertEqual(component.logs.maxlen, 100)
+        self.assertEqual(list(component.logs), [str(i) for i in range(50, 150)])
+
+    def test_find_component_uses_index_and_tracks_changes(self):
+        api = Component(name="api", status="Running")
+        project = Project(key="demo", name="Demo", components=[api])
+
+        self.assertIs(project.find_component("api"), api)
+
+        worker = Component(name="worker", status="Stopped")
+        project.components.append(worker)
+        self.assertIs(project.find_component("worker"), worker)
+        self.assertIsNone(project.find_component("missing"))
+
+    def test_component_lookup_follows_replaced_and_renamed_components(self):
+        project = Project(key="demo", name="Demo", components=[Component(name="api", status="Running")])
+        project.find_component("api")
+
+        web = Component(name="web", status="Running")
+        project.components = [web]
+        self.assertIs(project.find_component("web"), web)
+        project.ensure_component(Component(name="web", status="Stopped"))
+        self.assertEqual([(c.name, c.status) for c in project.components], [("web", "Stopped")])
+
+        project.components[0].name = "gateway"
+        self.assertIs(project.find_component("gateway"), project.components[0])
+        self.assertIsNone(project.find_component("web"))
+
+    def test_clone_does_not_share_mutable_state(self):
+        original = Project(
+            key="demo",
+            name="Demo",
+            tags=["web"],
+            components=[Component(name="api", status="Running", logs=["boot"])],
+        )
+
+        copy = original.clone()
+        copy.tags += ("api",)
+        copy.components[0].status = "Stopped"
+        copy.components[0].logs.append("stop")
+        copy.add_history("Stop api")
+
+        self.assertEqual(original.tags, ("web",))
+        self.assertEqual(original.components[0].status, "Running")
+        self.assertEqual(list(original.components[0].logs), ["boot"])
+        self.assertEqual(original.history, [])
+        self.assertIs(copy.find_component("api"), copy.components[0])
+
+    def test_to_payload_matches_separate_views(self):
+        project = Project(key="demo", name="Demo", tags=["web", "api"])
+
+        overview, detail = project.to_payload()
+
+        self.assertEqual(overview, project.to_overview())
+        self.assertEqual(detail, project.to_dict())
+
+    def test_tags_as_text_follows_reassigned_tags(self):
+        project = Project(key="demo", name="Demo", tags=["web", "api"])
+        self.assertEqual(project.tags_as_text, "web, api")
+
+        project.tags = ("cli",)
+        self.assertEqual(project.tags_as_text, "cli")
+        project.tags += ("ops",)
+        self.assertEqual(project.tags_as_text, "cli, ops")
+
+    def test_timestamps_round_trip_without_reformatting(self):
+        project = Project.from_dict({"key": "demo", "name": "Demo", "createdAt": "2024-01-02T03:04:05"})
+
+        self.assertEqual(project.to_dict()["createdAt"], "2024-01-02T03:04:05")
+        self.assertEqual(project.created_at, datetime(2024, 1, 2, 3, 4, 5))
+        self.assertIsNone(project.updated_at)
+
+        project.touch()
+        self.assertEqual(project.to_dict()["updatedAt"], project.updated_at.isoformat())
+
+    def test_timestamps_are_accepted_by_the_constructor(self):
+        created = datetime(2024, 1, 2, 3, 4, 5)
+        project = Project(key="demo", name="Demo", created_at=created)
+
+        self.assertEqual(project.created_at, created)
+        self.assertEqual(project.to_dict()["createdAt"], "2024-01-02T03:04:05")
+        self.assertEqual(project.clone().created_at, created)
+        self.assertIsNone(project.updated_at)
+
+        replaced = datetime(2025, 6, 7, 8, 9, 10)
+        project.created_at = replaced
+        self.assertEqual(project.to_dict()["createdAt"], replaced.isoformat())
+
+    def test_from_dict_rejects_malformed_timestamps(self):
+        with self.assertRaises(ValueError):
+            Project.from_dict({"key": "demo", "name": "Demo", "createdAt": "yesterday"})
+        with self.assertRaises(ValueError):
+            Project.from_dict({"key": "demo", "name": "Demo", "updatedAt": "2024-13-01"})
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,175 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# The GUI modules import ``core`` as a top-level package, as they do when the
+# application is started from ``src``.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from PySide6.QtCore import QCoreApplication, QModelIndex
+
+from core.database import ProjectDatabase
+from core.project import Project
+from gui.project_list_model import ProjectListModel
+from gui.project_store import ProjectStore
+
+_APP = QCoreApplication.instance() or QCoreApplication([])
+
+
+class _CountingDatabase(ProjectDatabase):
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.upsert_calls = 0
+
+    def upsert_projects(self, projects):
+        self.upsert_calls += 1
+        return super().upsert_projects(projects)
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for the event loop")
+        _APP.processEvents()
+        time.sleep(0.005)
+
+
+class _DatabaseTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.database = _CountingDatabase(Path(self._tmpdir.name) / "projects.db")
+
+    def tearDown(self):
+        self.database.close()
+        self._tmpdir.cleanup()
+
+    def _seed(self, count, **fields):
+        self.database.upsert_projects(
+            Project(key=f"p{index:03d}", name=f"Project {index}", **fields) for index in range(count)
+        )
+        self.database.upsert_calls = 0
+
+
+class TestProjectStore(_DatabaseTestCase):
+
+    def _load_store(self):
+        store = ProjectStore(self.database)
+        _wait_until(lambda: store.loaded)
+        return store
+
+    def test_failed_initial_load_reports_an_empty_store(self):
+        with mock.patch.object(self.database, "count_projects", side_effect=sqlite3.OperationalError("boom")):
+            with self.assertLogs("gui._model_common", level="ERROR"):
+                store = self._load_store()
+
+        self.assertEqual(store.projectsModel.rowCount(), 0)
+        self.assertTrue(store.create_from_summary({"key": "demo", "name": "Demo"}))
+
+    def test_flush_writes_several_edits_at_once(self):
+        self._seed(3)
+        store = self._load_store()
+        model = store.projectsModel
+
+        self.assertTrue(model.setData(model.index(0, 0), True, model.FavoriteRole))
+        self.assertTrue(model.setData(model.index(1, 0), "Running", model.StatusRole))
+        self.assertTrue(model.setData(model.index(0, 0), 2.5, model.UsageHoursRole))
+        self.assertEqual(self.database.upsert_calls, 0)
+
+        store.flush()
+        self.assertEqual(self.database.upsert_calls, 1)
+        saved = {project.key: project for project in self.database.list_projects()}
+        self.assertTrue(saved["p000"].favorite)
+        self.assertEqual(saved["p000"].usage_hours, 2.5)
+        self.assertEqual(saved["p001"].status, "Running")
+
+        store.flush()
+        self.assertEqual(self.database.upsert_calls, 1)
+
+    def test_non_finite_usage_hours_are_rejected(self):
+        self._seed(1)
+        store = self._load_store()
+        model = store.projectsModel
+
+        self.assertFalse(model.setData(model.index(0, 0), float("inf"), model.UsageHoursRole))
+        self.assertFalse(model.setData(model.index(0, 0), "nan", model.UsageHoursRole))
+        self.assertEqual(model.get(0)["usageHours"], 0.0)
+
+    def test_removing_last_use_of_a_tag_drops_the_option(self):
+        self._seed(1, tags=("shared",))
+        store = self._load_store()
+
+        self.assertTrue(store.create_from_summary({"key": "demo", "name": "Demo", "tags": "shared, beta"}))
+        self.assertEqual(store.tagOptions, ["beta", "shared"])
+
+        self.assertTrue(store.create_from_summary({"key": "demo", "name": "Demo", "tags": "shared"}))
+        self.assertEqual(store.tagOptions, ["shared"])
+
+    def test_pages_in_every_project_past_the_first_page(self):
+        self._seed(75)
+        store = self._load_store()
+        model = store.projectsModel
+
+        _wait_until(lambda: not model.canFetchMore(QModelIndex()))
+        self.assertEqual(model.rowCount(), 75)
+        self.assertEqual(len({model.get(row)["key"] for row in range(75)}), 75)
+        self.assertEqual(len(store.projectDetails), 75)
+        self.assertEqual(store.projectDetails["p070"], self.database.get_project("p070").to_dict())
+
+
+class TestProjectListModel(_DatabaseTestCase):
+
+    def test_end_batch_writes_once(self):
+        self._seed(3)
+        model = ProjectListModel(self.database)
+        _wait_until(lambda: model.rowCount() == 3)
+        changes = []
+        model.dataChanged.connect(lambda first, last, roles: changes.append((first.row(), last.row())))
+
+        model.beginBatch()
+        model.setData(model.index(0, 0), True, model.FavoriteRole)
+        model.setData(model.index(2, 0), "Stopped", model.StatusRole)
+        model.setData(model.index(0, 0), "Renamed", model.NameRole)
+        self.assertEqual(self.database.upsert_calls, 0)
+        model.endBatch()
+
+        self.assertEqual(self.database.upsert_calls, 1)
+        self.assertEqual(changes, [(0, 2)])
+        saved = {project.key: project for project in self.database.list_projects()}
+        self.assertTrue(saved["p000"].favorite)
+        self.assertEqual(saved["p000"].name, "Renamed")
+        self.assertEqual(saved["p002"].status, "Stopped")
+
+    def test_add_project_rejects_malformed_timestamps(self):
+        model = ProjectListModel(self.database)
+
+        self.assertFalse(model.addProject({"key": "bad", "name": "Bad", "createdAt": "yesterday"}))
+        self.assertTrue(model.addProject({"key": "ok", "name": "Ok", "createdAt": "2024-01-02T03:04:05"}))
+        self.assertEqual([project.key for project in self.database.list_projects()], ["ok"])
+
+    def test_unsaved_batch_edits_stay_out_of_the_database(self):
+        self._seed(1)
+        model = ProjectListModel(self.database)
+        _wait_until(lambda: model.rowCount() == 1)
+
+        model.beginBatch()
+        model.setData(model.index(0, 0), "Edited", model.NameRole)
+
+        self.assertEqual(self.database.get_project("p000").name, "Project 0")
+        other = ProjectListModel(self.database)
+        _wait_until(lambda: other.rowCount() == 1)
+        self.assertEqual(other.getProject("p000")["name"], "Project 0")
+        model.endBatch()
+        self.assertEqual(self.database.get_project("p000").name, "Edited")
+
+if __name__ == '__main__':
+    unittest.main()